@@ -3,18 +3,89 @@
 Daily metrics processing script.
 This script is run by systemd timer to process daily metrics and send reports.
 """
+import os
 import sys
 import yaml
+import pickle
 import logging
 from pathlib import Path
 from typing import Dict, Any
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent))
+# Prefer the LibYAML C parser when available - same behavior, much faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-from powermgr.utils.logger import setup_logging
-from powermgr.utils.metrics import MetricsRecorder
-from powermgr.utils.notifications import NotificationManager
+# powermgr imports happen inside process_daily_metrics / _get_notifier so a
+# timer invocation only pays for the modules it actually uses
+
+# Memoized NotificationManager - built (and smtplib imported) on first use
+_notifier = None
+
+
+def _get_notifier(config: Dict[str, Any]):
+    """
+    Create the NotificationManager lazily on first use.
+
+    Args:
+        config: Loaded configuration dictionary
+
+    Returns:
+        NotificationManager: Shared notifier instance
+    """
+    global _notifier
+    if _notifier is None:
+        from powermgr.utils.notifications import NotificationManager
+
+        notifications_config = config['notifications']
+        _notifier = NotificationManager(
+            smtp_config=notifications_config['smtp'],
+            recipients=notifications_config['recipients']
+        )
+    return _notifier
+
+
+def load_yaml_cached(config_file: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, using a pickle sidecar cache keyed on the source mtime.
+
+    Avoids re-parsing an unchanged config.yaml on every timer invocation;
+    the cache is rebuilt whenever the source file changes and ignored if it
+    is unreadable.
+
+    Args:
+        config_file: Path to the YAML configuration file
+
+    Returns:
+        dict: Parsed configuration
+    """
+    src_mtime = config_file.stat().st_mtime_ns
+    cache_file = config_file.with_suffix('.yaml.cache')
+
+    # Reuse the cached parse if the source file hasn't changed
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('mtime') == src_mtime:
+                return cached['data']
+        except Exception:
+            pass  # Corrupt or stale cache - fall through to a full parse
+
+    with open(config_file, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    # Write the cache atomically so a crash can't leave a partial file
+    try:
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            pickle.dump({'mtime': src_mtime, 'data': config}, f)
+        os.replace(temp_file, cache_file)
+    except Exception:
+        pass  # Caching is best-effort; the parsed config is still valid
+
+    return config
 
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
@@ -23,10 +94,9 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         config_file = Path(config_path)
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-        
+
+        config = load_yaml_cached(config_file)
+
         return config
         
     except Exception as e:
@@ -39,7 +109,10 @@ def process_daily_metrics():
     try:
         # Load configuration
         config = load_config()
-        
+
+        from powermgr.utils.logger import setup_logging
+        from powermgr.utils.metrics import MetricsRecorder
+
         # Set up logging
         log_config = config.get('logging', {})
         setup_logging(
@@ -56,12 +129,6 @@ def process_daily_metrics():
             permanent_metrics_dir=paths_config['permanent_metrics_dir']
         )
         
-        notifications_config = config['notifications']
-        notification_manager = NotificationManager(
-            smtp_config=notifications_config['smtp'],
-            recipients=notifications_config['recipients']
-        )
-        
         # Get daily summary before finalizing
         daily_summary = metrics_recorder.get_daily_summary()
         logger.info(f"Daily summary: {daily_summary}")
@@ -72,14 +139,14 @@ def process_daily_metrics():
         
         if eod_battery_level is not None and eod_battery_level <= eod_threshold:
             logger.warning(f"End-of-day battery level {eod_battery_level}% is below threshold {eod_threshold}%")
-            notification_manager.send_eod_battery_warning(eod_battery_level, eod_threshold)
+            _get_notifier(config).send_eod_battery_warning(eod_battery_level, eod_threshold)
         
         # Finalize daily metrics (save to permanent storage and reset state)
         saved_file = metrics_recorder.finalize_daily_metrics()
         logger.info(f"Daily metrics finalized and saved to: {saved_file}")
         
         # Send daily report
-        notification_manager.send_daily_report(daily_summary)
+        _get_notifier(config).send_daily_report(daily_summary)
         logger.info("Daily report sent")
         
         logger.info("Daily metrics processing completed successfully")
@@ -89,7 +156,7 @@ def process_daily_metrics():
         
         # Try to send error notification
         try:
-            notification_manager.notify('critical', 'api_error', {
+            _get_notifier(config).notify('critical', 'api_error', {
                 'Error': str(e),
                 'Script': 'daily_metrics.py',
                 'Action': 'Check system logs and fix the issue'
@@ -2,23 +2,67 @@
 """
 Power Manager - Main entry point for the power management service.
 """
+import os
 import sys
 import time
 import yaml
+import pickle
+import select
 import signal
 import logging
 from pathlib import Path
 from typing import Dict, Any
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent))
+# Prefer the LibYAML C parser when available - same behavior, much faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-from powermgr.core.manager import PowerManager
-from powermgr.services.tesla_api import TeslaAPI
-from powermgr.services.honeywell_api import HoneywellAPI
-from powermgr.utils.logger import setup_logging
-from powermgr.utils.metrics import MetricsRecorder
-from powermgr.utils.notifications import NotificationManager
+# The powermgr imports live in initialize_components so config loading and
+# validation don't pay for the full package (requests, smtplib, ...) import
+
+
+def load_yaml_cached(config_file: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, using a pickle sidecar cache keyed on the source mtime.
+
+    Parsing YAML is the most expensive part of startup; the sidecar reduces
+    repeat loads to a stat() plus pickle.load. The cache is rebuilt whenever
+    the source file changes and ignored if it is unreadable.
+
+    Args:
+        config_file: Path to the YAML configuration file
+
+    Returns:
+        dict: Parsed configuration
+    """
+    src_mtime = config_file.stat().st_mtime_ns
+    cache_file = config_file.with_suffix('.yaml.cache')
+
+    # Reuse the cached parse if the source file hasn't changed
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('mtime') == src_mtime:
+                return cached['data']
+        except Exception:
+            pass  # Corrupt or stale cache - fall through to a full parse
+
+    with open(config_file, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    # Write the cache atomically so a crash can't leave a partial file
+    try:
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            pickle.dump({'mtime': src_mtime, 'data': config}, f)
+        os.replace(temp_file, cache_file)
+    except Exception:
+        pass  # Caching is best-effort; the parsed config is still valid
+
+    return config
 
 
 class PowerManagerService:
@@ -28,18 +72,45 @@ class PowerManagerService:
         self.config_path = config_path
         self.config = None
         self.power_manager = None
-        self.running = False
         self.logger = None
-        
+
+        # Self-pipe woken by the signal machinery itself: any signal writes a
+        # byte to the pipe, so the run loop's select() returns instantly
+        # instead of polling a flag
+        self._shutdown = False
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        signal.set_wakeup_fd(self._wake_w)
+
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
-    
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
         if self.logger:
             self.logger.info(f"Received signal {signum}, shutting down gracefully...")
-        self.running = False
+        self._shutdown = True
+
+    def _wait_or_shutdown(self, timeout: float) -> bool:
+        """
+        Sleep until timeout elapses or a signal wakes the pipe.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if shutdown was requested while waiting
+        """
+        ready, _, _ = select.select([self._wake_r], [], [], timeout)
+        if ready:
+            # Drain the wakeup bytes so the next select blocks again
+            try:
+                os.read(self._wake_r, 64)
+            except BlockingIOError:
+                pass
+        return self._shutdown
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
@@ -48,14 +119,13 @@ class PowerManagerService:
             if not config_file.exists():
                 raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
             
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            # Validate required configuration sections
-            required_sections = ['tesla', 'honeywell', 'settings', 'paths', 'notifications']
-            for section in required_sections:
-                if section not in config:
-                    raise ValueError(f"Missing required configuration section: {section}")
+            config = load_yaml_cached(config_file)
+
+            # Validate required configuration sections with one set comparison
+            required_sections = frozenset(('tesla', 'honeywell', 'settings', 'paths', 'notifications'))
+            missing = required_sections - config.keys()
+            if missing:
+                raise ValueError(f"Missing required configuration sections: {sorted(missing)}")
             
             return config
             
@@ -65,6 +135,15 @@ class PowerManagerService:
     
     def initialize_components(self):
         """Initialize all system components."""
+        # Imported here so the service only loads API clients (and their
+        # dependency graph) once the configuration has validated
+        from powermgr.core.manager import PowerManager
+        from powermgr.services.tesla_api import TeslaAPI
+        from powermgr.services.honeywell_api import HoneywellAPI
+        from powermgr.utils.logger import setup_logging
+        from powermgr.utils.metrics import MetricsRecorder
+        from powermgr.utils.notifications import NotificationManager
+
         try:
             # Set up logging
             log_config = self.config.get('logging', {})
@@ -86,7 +165,7 @@ class PowerManagerService:
             
             # Initialize Honeywell API client
             honeywell_config = self.config['honeywell']
-            honeywell_client = HoneywellAPI(
+            honeywell_client = HoneywellAPI.get_shared(
                 username=honeywell_config['username'],
                 password=honeywell_config['password']
             )
@@ -129,32 +208,40 @@ class PowerManagerService:
         """Main service loop."""
         try:
             self.logger.info("Power Manager Service started")
-            self.running = True
-            
+
             # Get check interval from configuration
             check_interval = self.config['settings'].get('check_interval_seconds', 300)
-            
-            while self.running:
+
+            while not self._shutdown:
                 try:
                     # Run the power management check
                     self.power_manager.run_check()
-                    
-                    # Sleep until next check
-                    self.logger.debug(f"Sleeping for {check_interval} seconds until next check")
-                    
-                    # Use shorter sleep intervals to check for shutdown signals
-                    sleep_time = 0
-                    while sleep_time < check_interval and self.running:
-                        time.sleep(min(10, check_interval - sleep_time))
-                        sleep_time += 10
-                    
+
+                    # Sleep until next check; outside peak windows the manager
+                    # naps to the next phase boundary instead of a fixed interval
+                    sleep_target = self.power_manager.seconds_until_next_check(check_interval)
+                    self.logger.debug(f"Sleeping for {sleep_target:.0f} seconds until next check")
+
+                    # Wait against a monotonic deadline so stray (non-shutdown)
+                    # signal wakeups and clock adjustments don't cut the sleep
+                    # short; a shutdown signal still exits immediately
+                    deadline = time.monotonic() + sleep_target
+                    shutdown = False
+                    while not shutdown:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        shutdown = self._wait_or_shutdown(remaining)
+                    if shutdown:
+                        break
+
                 except KeyboardInterrupt:
                     self.logger.info("Received keyboard interrupt, shutting down...")
                     break
                 except Exception as e:
                     self.logger.error(f"Error in main loop: {str(e)}")
                     # Continue running after logging the error
-                    time.sleep(60)  # Wait a minute before retrying
+                    self._wait_or_shutdown(60)  # Wait a minute before retrying
             
         except Exception as e:
             self.logger.error(f"Fatal error in service: {str(e)}")
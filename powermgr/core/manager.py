@@ -1,8 +1,12 @@
 """
 Core power management logic and state machine.
 """
+import bisect
+import functools
 import logging
-from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from ..services.tesla_api import TeslaAPI
 from ..services.honeywell_api import HoneywellAPI
@@ -10,6 +14,19 @@ from ..utils.metrics import MetricsRecorder
 from ..utils.notifications import NotificationManager
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_hm(value: str) -> time:
+    """
+    Parse an 'HH:MM' config string to a time object, memoized per string.
+
+    A direct split avoids strptime's locale handling and format
+    compilation, while still accepting single-digit hours ('7:30') and
+    rejecting strings without a separator.
+    """
+    hour, minute = value.split(':')
+    return time(int(hour), int(minute))
+
+
 class PowerManager:
     """Core power management system with state machine logic."""
     
@@ -36,45 +53,143 @@ class PowerManager:
         # Extract configuration values
         self.settings = config['settings']
         self.dry_run = self.settings.get('dry_run', False)
-        self.holidays = set(self.settings['holidays'])
+        # Parse holidays to date objects once so membership tests don't
+        # need an isoformat() string allocation every cycle
+        self.holidays = frozenset(date.fromisoformat(s) for s in self.settings['holidays'])
         self.thermostat_increment = self.settings['thermostat_increment_f']
         self.precool_adjustment = self.settings['precool_adjustment_f']
         self.precool_threshold = self.settings['precool_threshold_f']
         self.eod_battery_threshold = self.settings['eod_battery_warning_threshold']
         self.thermostat_ids = self.settings['thermostat_ids']
         self.battery_thresholds = self.settings['battery_thresholds']
+        # Flatten thresholds into parallel lists so the per-tick check is
+        # plain list indexing instead of repeated dict lookups
+        self._threshold_times = [t['time_remaining_minutes'] for t in self.battery_thresholds]
+        self._threshold_levels = [t['level_percent'] for t in self.battery_thresholds]
         self.max_thermostat_adjustments = self.settings.get('max_thermostat_adjustments', 3)
         self.max_thermostat_temp = self.settings.get('max_thermostat_temp_f', 82)
         self.min_thermostat_temp = self.settings.get('min_thermostat_temp_f', 67)
-        
-        # Note: All datetime operations use system local timezone
-        
+
+        # Precompute peak-period boundaries per month so the check cycle
+        # doesn't re-parse time strings and rebuild datetimes on every tick
+        self._season_by_month = self._build_season_lookup()
+
+        # Last reserve setting seen or written, so steady-state ticks don't
+        # re-read the reserve from the Tesla API just to find no change.
+        # Populates lazily on the first cycle after a restart.
+        self._known_reserve: Optional[int] = None
+
+        # Daily phase schedule: a sorted list of (seconds-of-day, phase,
+        # active_period) segments rebuilt on date rollover, so the per-tick
+        # phase lookup is a single bisect instead of walking peak periods
+        self._schedule_date: Optional[date] = None
+        self._schedule_boundaries: List[int] = []
+        self._schedule_entries: List[Tuple[str, Optional[Tuple]]] = []
+
+        # Tesla status snapshot for the current cycle; fetched once at the
+        # top of run_check and consumed by the handlers below
+        self._tick_status: Optional[Dict[str, Any]] = None
+
+        # Construct the tzinfo once; zoneinfo is C-backed and caches per
+        # zone, and its tzinfo works directly with datetime.now() - no
+        # pytz-style localize(). Without a configured location, naive
+        # local time is used.
+        location = self.settings.get('location')
+        self.timezone = ZoneInfo(location) if location else None
+
+        # Small pool for fanning out independent I/O (health checks); kept
+        # for the manager's lifetime so threads aren't respawned per cycle
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Cool setpoints read this cycle, so adjust/precool paths that run
+        # in the same tick don't re-fetch the same thermostat
+        self._setpoint_cache: Dict[str, int] = {}
+
         self.logger.info("PowerManager initialized successfully")
+
+    def _build_season_lookup(self) -> Dict[int, List[Tuple]]:
+        """
+        Build a month -> peak-period boundary lookup from the seasons config.
+
+        Each peak period is expanded once into a tuple of precomputed
+        boundaries: (peak_start, peak_end, pre_peak_start, peak_start_window,
+        peak_end_grace, end_seconds) where the first five are time objects and
+        end_seconds is the peak end expressed as seconds from midnight.
+
+        Returns:
+            dict: Mapping of month number to list of boundary tuples
+        """
+        season_by_month = {}
+
+        for season_config in self.settings['seasons'].values():
+            periods = []
+            for peak_period in season_config['peak_periods']:
+                peak_start = _parse_hm(peak_period['start'])
+                peak_end = _parse_hm(peak_period['end'])
+
+                periods.append((
+                    peak_start,
+                    peak_end,
+                    self._offset_time(peak_start, -30),  # pre-peak window opens
+                    self._offset_time(peak_start, 5),    # end of PEAK_START window
+                    self._offset_time(peak_end, 30),     # end of PEAK_END grace
+                    peak_end.hour * 3600 + peak_end.minute * 60
+                ))
+
+            for month in season_config['months']:
+                season_by_month[month] = periods
+
+        return season_by_month
+
+    @staticmethod
+    def _offset_time(base: time, minutes: int) -> time:
+        """Return a time object offset from base by the given minutes."""
+        total = (base.hour * 60 + base.minute + minutes) % (24 * 60)
+        return time(total // 60, total % 60)
     
-    def run_check(self) -> None:
-        """Main method called in the service loop - executes the state machine."""
+    def run_check(self, now: Optional[datetime] = None) -> None:
+        """
+        Main method called in the service loop - executes the state machine.
+
+        Args:
+            now: Wall-clock snapshot for this tick; taken once here and passed
+                 through so every check in the cycle sees the same instant
+        """
         try:
+            if now is None:
+                now = datetime.now(self.timezone)
+
             self.logger.debug("Starting power management check cycle")
-            
+
+            # Fetch the Tesla snapshot once per cycle; the health check and
+            # handlers consume it instead of issuing their own round-trips.
+            # Setpoints cached last cycle are stale by now - drop them
+            self._setpoint_cache.clear()
+            self._tick_status = self.tesla.get_site_status()
+
             # Perform health check first
             if not self._run_health_check():
                 self.logger.error("Health check failed, skipping this cycle")
                 return
             
-            # Determine current operational phase
-            current_phase = self._get_current_phase()
+            # Determine current operational phase and the peak period driving
+            # it, so downstream checks don't re-walk the season tables
+            current_phase, active_peak = self._get_current_phase(now)
             self.logger.info(f"Current phase: {current_phase}")
-            
+
             # Execute phase-specific logic
             if current_phase == "NON_PEAK":
                 self._handle_non_peak_period()
             elif current_phase == "PRE_PEAK":
                 self._handle_pre_peak_period()
             elif current_phase in ["PEAK_START", "PEAK_MONITOR"]:
-                self._handle_peak_period()
+                self._handle_peak_period(active_peak, now)
             elif current_phase == "PEAK_END":
                 self._handle_peak_end()
-            
+
+            # Land everything this cycle queued in one write; between
+            # cycles the recorder's queue keeps disk untouched
+            self.metrics.flush()
             self.logger.debug("Power management check cycle completed")
             
         except Exception as e:
@@ -94,8 +209,18 @@ class PowerManager:
             bool: True if all systems are healthy
         """
         try:
-            tesla_healthy = self.tesla.health_check()
-            honeywell_healthy = self.honeywell.health_check()
+            # Use the per-cycle snapshot when available; fall back to a
+            # dedicated health check call when invoked standalone. Both
+            # checks are independent HTTP calls, so in the standalone case
+            # run them concurrently - total latency is max, not sum
+            if self._tick_status is not None:
+                tesla_healthy = self._tick_status['healthy']
+                honeywell_healthy = self.honeywell.health_check()
+            else:
+                tesla_future = self._io_pool.submit(self.tesla.health_check)
+                honeywell_future = self._io_pool.submit(self.honeywell.health_check)
+                tesla_healthy = tesla_future.result(timeout=60)
+                honeywell_healthy = honeywell_future.result(timeout=60)
             
             if not tesla_healthy:
                 self.logger.warning("Tesla API health check failed")
@@ -117,68 +242,123 @@ class PowerManager:
             self.logger.error(f"Health check error: {str(e)}")
             return False
     
-    def _get_current_phase(self) -> str:
+    def _get_current_phase(self, now: Optional[datetime] = None) -> Tuple[str, Optional[Tuple]]:
         """
         Determine current operational phase based on time and season.
-        
+
+        Args:
+            now: Wall-clock snapshot for this tick (defaults to datetime.now())
+
         Returns:
-            str: Current phase (NON_PEAK, PRE_PEAK, PEAK_START, PEAK_MONITOR, PEAK_END)
+            tuple: (phase, active_peak_period) where phase is one of NON_PEAK,
+                   PRE_PEAK, PEAK_START, PEAK_MONITOR, PEAK_END and
+                   active_peak_period is the precomputed boundary tuple
+                   driving that phase (None for NON_PEAK)
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_date = now.date()
-        current_time = now.time()
-        
-        # Check if today is a weekend or holiday
-        if current_date.weekday() >= 5 or current_date.isoformat() in self.holidays:
-            return "NON_PEAK"
-        
-        # Determine current season
-        current_month = now.month
-        season = None
-        
-        for season_name, season_config in self.settings['seasons'].items():
-            if current_month in season_config['months']:
-                season = season_config
-                break
-        
-        if not season:
-            self.logger.error(f"No season configuration found for month {current_month}")
-            return "NON_PEAK"
-        
-        # Check if we're in any peak period
-        for peak_period in season['peak_periods']:
-            peak_start = datetime.strptime(peak_period['start'], '%H:%M').time()
-            peak_end = datetime.strptime(peak_period['end'], '%H:%M').time()
-            
-            # Calculate pre-peak time (30 minutes before peak)
-            pre_peak_start = (datetime.combine(current_date, peak_start) - timedelta(minutes=30)).time()
-            
-            # Determine phase within this peak period
-            if pre_peak_start <= current_time < peak_start:
-                return "PRE_PEAK"
-            elif peak_start <= current_time <= peak_end:
-                # Check if we're at the very start of peak (first 5 minutes)
-                peak_start_window = (datetime.combine(current_date, peak_start) + timedelta(minutes=5)).time()
-                if current_time <= peak_start_window:
-                    return "PEAK_START"
-                else:
-                    return "PEAK_MONITOR"
-            elif peak_end < current_time <= (datetime.combine(current_date, peak_end) + timedelta(minutes=30)).time():
-                return "PEAK_END"
-        
-        return "NON_PEAK"
+
+        # Rebuild the day's schedule on date rollover
+        if current_date != self._schedule_date:
+            schedule = self.build_daily_schedule(current_date)
+            self._schedule_date = current_date
+            self._schedule_boundaries = [entry[0] for entry in schedule]
+            self._schedule_entries = [(entry[1], entry[2]) for entry in schedule]
+
+        # The tick's phase is the segment the current second falls into
+        now_seconds = now.hour * 3600 + now.minute * 60 + now.second
+        idx = bisect.bisect_right(self._schedule_boundaries, now_seconds) - 1
+        return self._schedule_entries[idx]
+
+    def build_daily_schedule(self, for_date: date) -> List[Tuple[int, str, Optional[Tuple]]]:
+        """
+        Build the ordered phase schedule for a single day.
+
+        Each entry marks the second of the day a phase segment begins, so
+        phase lookup for any instant is a bisect over the boundary list.
+
+        Args:
+            for_date: Date to build the schedule for
+
+        Returns:
+            list: (start_seconds, phase, active_peak_period) segments sorted
+                  by start time, always beginning with (0, "NON_PEAK", None)
+        """
+        schedule = [(0, "NON_PEAK", None)]
+
+        # Weekends and holidays are NON_PEAK all day
+        if for_date.weekday() >= 5 or for_date in self.holidays:
+            return schedule
+
+        periods = self._season_by_month.get(for_date.month)
+        if not periods:
+            self.logger.error(f"No season configuration found for month {for_date.month}")
+            return schedule
+
+        for period in periods:
+            peak_start, peak_end, pre_peak_start, peak_start_window, peak_end_grace, end_seconds = period
+            start_seconds = peak_start.hour * 3600 + peak_start.minute * 60
+            schedule.extend([
+                (pre_peak_start.hour * 3600 + pre_peak_start.minute * 60, "PRE_PEAK", period),
+                (start_seconds, "PEAK_START", period),
+                # The PEAK_START window and peak end are inclusive bounds, so
+                # the following segments begin one second later
+                (peak_start_window.hour * 3600 + peak_start_window.minute * 60 + 1, "PEAK_MONITOR", period),
+                (end_seconds + 1, "PEAK_END", period),
+                (peak_end_grace.hour * 3600 + peak_end_grace.minute * 60 + 1, "NON_PEAK", None),
+            ])
+
+        schedule.sort(key=lambda entry: entry[0])
+        return schedule
     
+    def classify_phases(self, timestamps: List[datetime]) -> List[str]:
+        """
+        Classify many timestamps into operational phases in one pass.
+
+        Back-fill/reporting helper: rather than calling _get_current_phase
+        per timestamp, the daily schedule is built once per distinct date
+        and each timestamp then resolves with a single bisect, so N
+        classifications cost N log-time lookups plus one schedule build
+        per day covered.
+
+        Args:
+            timestamps: Datetimes to classify, in any order
+
+        Returns:
+            list: Phase name for each timestamp, in input order
+        """
+        schedules: Dict[date, Tuple[List[int], List[str]]] = {}
+        phases = []
+
+        for ts in timestamps:
+            ts_date = ts.date()
+            cached = schedules.get(ts_date)
+            if cached is None:
+                schedule = self.build_daily_schedule(ts_date)
+                cached = ([entry[0] for entry in schedule],
+                          [entry[1] for entry in schedule])
+                schedules[ts_date] = cached
+
+            boundaries, names = cached
+            ts_seconds = ts.hour * 3600 + ts.minute * 60 + ts.second
+            phases.append(names[bisect.bisect_right(boundaries, ts_seconds) - 1])
+
+        return phases
+
     def _handle_non_peak_period(self) -> None:
         """Handle non-peak period operations."""
         try:
-            # Set battery reserve to 100% during non-peak hours
-            current_reserve = self.tesla.get_battery_reserve_setting()
-            
+            # Set battery reserve to 100% during non-peak hours; only query the
+            # API when we don't already know the current setting
+            current_reserve = self._get_known_reserve()
+
             if current_reserve != 100:
                 if self.dry_run:
                     self.logger.info(f"DRY RUN: Would set Tesla battery reserve to 100% (currently {current_reserve}%)")
                 else:
                     self.tesla.set_reserve_percentage(100)
+                    self._known_reserve = 100
                 self.metrics.record_action('set_battery_reserve', {
                     'previous_reserve': current_reserve,
                     'new_reserve': 100,
@@ -209,32 +389,44 @@ class PowerManager:
             self.logger.error(f"Error in pre-peak handling: {str(e)}")
             raise
     
-    def _handle_peak_period(self) -> None:
-        """Handle peak period operations (main battery management logic)."""
+    def _handle_peak_period(self, active_peak: Optional[Tuple] = None,
+                            now: Optional[datetime] = None) -> None:
+        """
+        Handle peak period operations (main battery management logic).
+
+        Args:
+            active_peak: Precomputed boundary tuple for the current peak
+                         period, when already resolved by the phase check
+            now: Wall-clock snapshot for this tick
+        """
         try:
             # Get current battery status
-            battery_percent = self.tesla.get_battery_charge()
-            current_reserve = self.tesla.get_battery_reserve_setting()
-            
-            # Record battery level
-            self.metrics.record_battery_level(battery_percent)
-            
+            battery_percent = self._get_tick_battery_charge()
+            current_reserve = self._get_known_reserve()
+
+            # Buffer this tick's events and flush them in one metrics write
+            pending_events = [{'battery_percent': battery_percent}]
+
             # Set reserve to 0% during peak if not already set
             if current_reserve != 0:
                 if self.dry_run:
                     self.logger.info(f"DRY RUN: Would set Tesla battery reserve to 0% (currently {current_reserve}%)")
                 else:
                     self.tesla.set_reserve_percentage(0)
-                self.metrics.record_action('set_battery_reserve', {
+                    self._known_reserve = 0
+                pending_events.append({
+                    'action': 'set_battery_reserve',
                     'previous_reserve': current_reserve,
                     'new_reserve': 0,
                     'reason': 'peak_period',
                     'battery_level': battery_percent
                 })
                 self.logger.info("Set battery reserve to 0% for peak period")
-            
+
+            self.metrics.record_events_bulk(pending_events)
+
             # Check if battery adjustment is needed
-            if self._is_battery_low():
+            if self._is_battery_low(active_peak, now):
                 self._adjust_thermostats_for_battery_conservation()
             
         except Exception as e:
@@ -252,20 +444,117 @@ class PowerManager:
             self.logger.error(f"Error in peak-end handling: {str(e)}")
             raise
     
-    def _is_battery_low(self) -> bool:
+    def seconds_until_next_check(self, check_interval: int) -> float:
+        """
+        Choose how long the service loop should sleep before the next check.
+
+        During pre-peak/peak phases this is the regular check interval so the
+        battery keeps being monitored. Deep in NON_PEAK the loop can nap all
+        the way to the next phase boundary instead of waking every interval
+        only to find nothing to do.
+
+        The phase is derived from the schedule rather than the last completed
+        cycle, so a failed health check mid-peak still retries at the normal
+        interval instead of napping to the next boundary.
+
+        Args:
+            check_interval: Configured check interval in seconds
+
+        Returns:
+            float: Seconds to sleep before the next check
+        """
+        current_phase, _ = self._get_current_phase(datetime.now(self.timezone))
+        if current_phase != "NON_PEAK":
+            return check_interval
+        return max(check_interval, self.time_until_next_boundary())
+
+    def time_until_next_boundary(self) -> float:
+        """
+        Calculate seconds until the next peak-period boundary today.
+
+        Boundaries are the precomputed pre-peak start, peak start, end of the
+        PEAK_START window, peak end, and end of the PEAK_END grace window. If
+        no boundary remains today (weekend, holiday, or all periods passed),
+        returns the time until midnight so the schedule is re-evaluated for
+        the new day.
+
+        Returns:
+            float: Seconds until the next boundary
+        """
+        try:
+            now = datetime.now(self.timezone)
+            now_seconds = now.hour * 3600 + now.minute * 60 + now.second
+
+            # Boundaries only matter on business days with a configured season
+            if now.weekday() < 5 and now.date() not in self.holidays:
+                upcoming = []
+                for boundaries in self._season_by_month.get(now.month, []):
+                    for boundary in boundaries[:5]:
+                        boundary_seconds = boundary.hour * 3600 + boundary.minute * 60
+                        if boundary_seconds > now_seconds:
+                            upcoming.append(boundary_seconds - now_seconds)
+                if upcoming:
+                    return min(upcoming)
+
+            # Nothing left today - sleep to midnight and re-evaluate
+            return 24 * 3600 - now_seconds
+
+        except Exception as e:
+            self.logger.error(f"Error calculating next boundary: {str(e)}")
+            return 300  # Fall back to frequent checks on error
+
+    def _get_known_reserve(self) -> int:
+        """
+        Return the current battery reserve setting.
+
+        The per-cycle snapshot is always preferred when it carries a reserve
+        value - it is fetched fresh every tick, so changes made outside this
+        service (e.g. via the Tesla app) are observed and corrected. A
+        dedicated API read happens only when there is no snapshot and no
+        locally tracked value (e.g. standalone calls after restart).
+
+        Returns:
+            int: Reserve percentage setting (0-100)
+        """
+        if (self._tick_status is not None
+                and self._tick_status.get('reserve_percent') is not None):
+            self._known_reserve = self._tick_status['reserve_percent']
+        elif self._known_reserve is None:
+            self._known_reserve = self.tesla.get_battery_reserve_setting()
+        return self._known_reserve
+
+    def _get_tick_battery_charge(self) -> float:
+        """
+        Return the battery charge from the per-cycle snapshot, falling back
+        to a direct API call when no snapshot is available.
+
+        Returns:
+            float: Battery charge percentage (0-100)
+        """
+        if self._tick_status is not None and self._tick_status.get('battery_percent') is not None:
+            return self._tick_status['battery_percent']
+        return self.tesla.get_battery_charge()
+
+    def _is_battery_low(self, active_peak: Optional[Tuple] = None,
+                        now: Optional[datetime] = None) -> bool:
         """
         Determine if battery level is low based on time remaining in peak period.
         Uses progressive thresholds - only checks the next threshold based on adjustments already made.
-        
+
+        Args:
+            active_peak: Precomputed boundary tuple for the current peak
+                         period, when already resolved by the phase check
+            now: Wall-clock snapshot for this tick
+
         Returns:
             bool: True if battery is considered low for current conditions
         """
         try:
             # Get current battery level
-            battery_percent = self.tesla.get_battery_charge()
-            
+            battery_percent = self._get_tick_battery_charge()
+
             # Calculate time remaining in current peak period
-            time_remaining = self._get_peak_time_remaining()
+            time_remaining = self._get_peak_time_remaining(active_peak, now)
             
             if time_remaining is None:
                 return False
@@ -279,11 +568,9 @@ class PowerManager:
                 return False
             
             # Only check the next threshold based on adjustments already made
-            if adjustments_made < len(self.battery_thresholds):
-                threshold = self.battery_thresholds[adjustments_made]
-                
-                if time_remaining >= threshold['time_remaining_minutes']:
-                    if battery_percent <= threshold['level_percent']:
+            if adjustments_made < len(self._threshold_times):
+                if time_remaining >= self._threshold_times[adjustments_made]:
+                    if battery_percent <= self._threshold_levels[adjustments_made]:
                         self.logger.warning(f"Battery low (threshold {adjustments_made + 1}): {battery_percent}% with {time_remaining} minutes remaining")
                         return True
             
@@ -293,71 +580,139 @@ class PowerManager:
             self.logger.error(f"Error checking battery level: {str(e)}")
             return False
     
-    def _get_peak_time_remaining(self) -> Optional[int]:
+    def _get_peak_time_remaining(self, active_peak: Optional[Tuple] = None,
+                                 now: Optional[datetime] = None) -> Optional[int]:
         """
         Calculate minutes remaining in current peak period.
-        
+
+        Args:
+            active_peak: Precomputed boundary tuple for the current peak
+                         period; when omitted the season table is searched
+            now: Wall-clock snapshot for this tick
+
         Returns:
             int or None: Minutes remaining in peak period, None if not in peak
         """
         try:
-            now = datetime.now()
+            if now is None:
+                now = datetime.now()
+            now_seconds = now.hour * 3600 + now.minute * 60 + now.second
+
+            # Use the already-resolved period when the caller has one
+            if active_peak is not None:
+                return int((active_peak[5] - now_seconds) / 60)
+
             current_time = now.time()
-            current_month = now.month
-            
-            # Find current season
-            for season_config in self.settings['seasons'].values():
-                if current_month in season_config['months']:
-                    # Check each peak period
-                    for peak_period in season_config['peak_periods']:
-                        peak_start = datetime.strptime(peak_period['start'], '%H:%M').time()
-                        peak_end = datetime.strptime(peak_period['end'], '%H:%M').time()
-                        
-                        if peak_start <= current_time <= peak_end:
-                            # Calculate time remaining
-                            end_datetime = datetime.combine(now.date(), peak_end)
-                            time_remaining = (end_datetime - now).total_seconds() / 60
-                            return int(time_remaining)
-            
+
+            # Check the precomputed peak periods for the current month
+            for peak_start, peak_end, _, _, _, end_seconds in self._season_by_month.get(now.month, []):
+                if peak_start <= current_time <= peak_end:
+                    # Calculate time remaining from seconds since midnight
+                    return int((end_seconds - now_seconds) / 60)
+
             return None
             
         except Exception as e:
             self.logger.error(f"Error calculating peak time remaining: {str(e)}")
             return None
     
+    def _get_cool_setpoint(self, thermostat_id: str) -> int:
+        """
+        Return a thermostat's cool setpoint, cached for the current cycle.
+
+        Args:
+            thermostat_id: Thermostat to read
+
+        Returns:
+            int: Current cool setpoint in degrees F
+        """
+        setpoint = self._setpoint_cache.get(thermostat_id)
+        if setpoint is None:
+            setpoint = self.honeywell.get_cool_setpoint(thermostat_id)
+            self._setpoint_cache[thermostat_id] = setpoint
+        return setpoint
+
+    def _change_setpoints_parallel(self, delta: int, dry_run_verb: str) -> List[Tuple[str, int, int, bool]]:
+        """
+        Apply a setpoint delta to all thermostats, fanning the HTTP calls out
+        in parallel so latency is ~1 round-trip instead of N sequential ones.
+
+        Args:
+            delta: Degrees F to add to each thermostat's cool setpoint
+            dry_run_verb: Verb for the dry-run log message (e.g. 'adjust')
+
+        Returns:
+            list: (thermostat_id, previous_setpoint, new_setpoint, success)
+                  tuples for every thermostat whose change was attempted
+                  (skipped and errored thermostats are excluded)
+        """
+        with ThreadPoolExecutor(max_workers=len(self.thermostat_ids)) as executor:
+            # Phase 1: read all current setpoints in parallel
+            current_setpoints = {}
+            read_futures = [(tid, executor.submit(self._get_cool_setpoint, tid))
+                            for tid in self.thermostat_ids]
+            for thermostat_id, future in read_futures:
+                try:
+                    current_setpoints[thermostat_id] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error reading thermostat {thermostat_id}: {str(e)}")
+                    continue
+
+            # Phase 2: decide the write set in one pass over the fetched values
+            write_set = []
+            for thermostat_id, current_setpoint in current_setpoints.items():
+                new_setpoint = current_setpoint + delta
+
+                # Safety check - keep setpoint within configured bounds
+                if self.min_thermostat_temp <= new_setpoint <= self.max_thermostat_temp:
+                    write_set.append((thermostat_id, current_setpoint, new_setpoint))
+                else:
+                    self.logger.warning(f"Skipped thermostat {thermostat_id} - new setpoint {new_setpoint}°F outside allowed range {self.min_thermostat_temp}-{self.max_thermostat_temp}°F")
+
+            # Phase 3: issue the surviving writes in parallel
+            results = []
+            if self.dry_run:
+                for thermostat_id, current_setpoint, new_setpoint in write_set:
+                    self.logger.info(f"DRY RUN: Would {dry_run_verb} thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
+                    results.append((thermostat_id, current_setpoint, new_setpoint, True))
+            else:
+                write_futures = [
+                    (entry, executor.submit(self.honeywell.set_thermostat_cool_setpoint, entry[0], entry[2]))
+                    for entry in write_set
+                ]
+                for (thermostat_id, current_setpoint, new_setpoint), future in write_futures:
+                    try:
+                        results.append((thermostat_id, current_setpoint, new_setpoint, future.result()))
+                        # Keep the cycle cache consistent with what was written
+                        self._setpoint_cache[thermostat_id] = new_setpoint
+                    except Exception as e:
+                        self.logger.error(f"Error adjusting thermostat {thermostat_id}: {str(e)}")
+                        continue
+
+        return results
+
     def _adjust_thermostats_for_battery_conservation(self) -> None:
         """Adjust all thermostats to conserve battery during peak periods."""
-        for thermostat_id in self.thermostat_ids:
-            try:
-                current_setpoint = self.honeywell.get_cool_setpoint(thermostat_id)
-                new_setpoint = current_setpoint + self.thermostat_increment
-                
-                # Safety check - don't set too high
-                if new_setpoint <= self.max_thermostat_temp:
-                    if self.dry_run:
-                        self.logger.info(f"DRY RUN: Would adjust thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
-                        success = True  # Simulate success for dry run
-                    else:
-                        success = self.honeywell.set_thermostat_cool_setpoint(thermostat_id, new_setpoint)
-                    
-                    if success:
-                        self.metrics.record_action('adjust_thermostat', {
-                            'thermostat_id': thermostat_id,
-                            'previous_setpoint': current_setpoint,
-                            'new_setpoint': new_setpoint,
-                            'reason': 'battery_conservation'
-                        })
-                        
-                        self.logger.info(f"Adjusted thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
-                    else:
-                        self.logger.error(f"Failed to adjust thermostat {thermostat_id}")
-                else:
-                    self.logger.warning(f"Skipped thermostat {thermostat_id} - new setpoint {new_setpoint}°F exceeds max temp {self.max_thermostat_temp}°F")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adjusting thermostat {thermostat_id}: {str(e)}")
-                continue
-        
+        results = self._change_setpoints_parallel(self.thermostat_increment, 'adjust')
+
+        pending_actions = []
+        for thermostat_id, current_setpoint, new_setpoint, success in results:
+            if success:
+                pending_actions.append({
+                    'action': 'adjust_thermostat',
+                    'thermostat_id': thermostat_id,
+                    'previous_setpoint': current_setpoint,
+                    'new_setpoint': new_setpoint,
+                    'reason': 'battery_conservation'
+                })
+
+                self.logger.info(f"Adjusted thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
+            else:
+                self.logger.error(f"Failed to adjust thermostat {thermostat_id}")
+
+        # Flush all thermostat actions in a single metrics write
+        self.metrics.record_events_bulk(pending_actions)
+
         # Increment adjustment counter
         state = self.metrics.load_state()
         state['thermostat_adjustments_this_peak'] = state.get('thermostat_adjustments_this_peak', 0) + 1
@@ -375,37 +730,26 @@ class PowerManager:
     def _activate_precooling(self) -> None:
         """Activate precooling by lowering thermostat setpoints."""
         try:
-            for thermostat_id in self.thermostat_ids:
-                try:
-                    current_setpoint = self.honeywell.get_cool_setpoint(thermostat_id)
-                    new_setpoint = current_setpoint - self.precool_adjustment
-                    
-                    # Safety check - don't set too low
-                    if new_setpoint >= self.min_thermostat_temp:
-                        if self.dry_run:
-                            self.logger.info(f"DRY RUN: Would precool thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
-                            success = True  # Simulate success for dry run
-                        else:
-                            success = self.honeywell.set_thermostat_cool_setpoint(thermostat_id, new_setpoint)
-                        
-                        if success:
-                            self.metrics.record_action('adjust_thermostat', {
-                                'thermostat_id': thermostat_id,
-                                'previous_setpoint': current_setpoint,
-                                'new_setpoint': new_setpoint,
-                                'reason': 'precooling'
-                            })
-                            
-                            self.logger.info(f"Precool thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
-                        else:
-                            self.logger.error(f"Failed to precool thermostat {thermostat_id}")
-                    else:
-                        self.logger.warning(f"Skipped precool thermostat {thermostat_id} - new setpoint {new_setpoint}°F below min temp {self.min_thermostat_temp}°F")
-                        
-                except Exception as e:
-                    self.logger.error(f"Error precooling thermostat {thermostat_id}: {str(e)}")
-                    continue
-            
+            results = self._change_setpoints_parallel(-self.precool_adjustment, 'precool')
+
+            pending_actions = []
+            for thermostat_id, current_setpoint, new_setpoint, success in results:
+                if success:
+                    pending_actions.append({
+                        'action': 'adjust_thermostat',
+                        'thermostat_id': thermostat_id,
+                        'previous_setpoint': current_setpoint,
+                        'new_setpoint': new_setpoint,
+                        'reason': 'precooling'
+                    })
+
+                    self.logger.info(f"Precool thermostat {thermostat_id}: {current_setpoint}°F → {new_setpoint}°F")
+                else:
+                    self.logger.error(f"Failed to precool thermostat {thermostat_id}")
+
+            # Flush all thermostat actions in a single metrics write
+            self.metrics.record_events_bulk(pending_actions)
+
             # Set precooling status
             self.metrics.set_precooling_status(True)
             
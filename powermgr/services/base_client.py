@@ -1,35 +1,128 @@
 """
 Base API client with retry logic and error handling.
 """
-import time
 import logging
+import functools
+import threading
 import requests
 from typing import Dict, Any, Optional
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# orjson is an optional accelerator for decoding response bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=8)
+def _get_adapter(max_retries: int) -> HTTPAdapter:
+    """
+    Build an HTTPAdapter with the standard retry strategy, cached per policy.
+
+    The Retry object and adapter are identical for every client using the
+    same max_retries, so construct them once; clients that share an adapter
+    also share its connection pool.
+
+    Args:
+        max_retries: Maximum retry attempts for the retry strategy
+
+    Returns:
+        HTTPAdapter: Configured adapter with retry strategy and enlarged pool
+    """
+    retry_strategy = Retry(
+        total=max_retries,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        backoff_factor=1,
+        respect_retry_after_header=True
+    )
+    return HTTPAdapter(max_retries=retry_strategy,
+                       pool_connections=32, pool_maxsize=32)
+
 
 class BaseAPIClient:
     """Base class for API clients with built-in retry logic and error handling."""
-    
-    def __init__(self, base_url: str = "", timeout: int = 30, max_retries: int = 3):
+
+    def __init__(self, base_url: str = "", timeout: int = 30, max_retries: int = 3,
+                 session: Optional[requests.Session] = None):
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.logger = logging.getLogger(self.__class__.__name__)
-        
-        # Configure session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
-            respect_retry_after_header=True
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
+
+        # Each client owns its Session - sessions carry per-account state
+        # (cookies, auth headers) that must not leak between clients - but
+        # mounts the cached adapter, so the retry policy and the warm
+        # urllib3 connection pool are still shared across instances
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            adapter = _get_adapter(max_retries)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+        # Endpoints form a small closed set, so join each one to the base
+        # URL once instead of re-stripping slashes on every request
+        self._base = base_url.rstrip('/')
+        self._url_cache: Dict[str, str] = {}
+
+    def _build_url(self, endpoint: str) -> str:
+        """Join endpoint to the base URL, memoizing per endpoint."""
+        if endpoint.startswith('http') or not self._base:
+            return endpoint
+
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache.setdefault(endpoint, f"{self._base}/{endpoint.lstrip('/')}")
+        return url
+
+    def warm_up(self) -> None:
+        """
+        Establish the TCP+TLS connection in the background ahead of first use.
+
+        Issues one HEAD request to the base URL from a daemon thread; the
+        warmed connection is returned to the shared pool, so the first real
+        request reuses it (and its TLS session) instead of paying the full
+        handshake. Failures are ignored - the first real request will simply
+        connect as usual.
+        """
+        if not self._base:
+            return
+
+        def _ping():
+            try:
+                self.session.head(self._base, timeout=self.timeout,
+                                  allow_redirects=False)
+            except Exception:
+                pass  # Warmup is best-effort
+
+        threading.Thread(target=_ping, name='connection-warmup', daemon=True).start()
+
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """
+        Parse a JSON response body, preferring the orjson decoder.
+
+        orjson decodes straight from the raw bytes and is several times
+        faster than the stdlib parser; response.json() is the fallback
+        when orjson isn't installed.
+
+        Args:
+            response: Response whose body should be decoded
+
+        Returns:
+            Decoded JSON value
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
         Make HTTP request with error handling and logging.
@@ -41,23 +134,29 @@ class BaseAPIClient:
             
         Returns:
             requests.Response object
-            
+
         Raises:
             requests.RequestException: If request fails after retries
+
+        Note:
+            This is the single point of HTTP error escalation - callers
+            receive a response that already passed raise_for_status and
+            must not call it again.
         """
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}" if self.base_url else endpoint
+        url = self._build_url(endpoint)
         
         # Set default timeout if not provided
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
             
-        self.logger.debug(f"Making {method} request to {url}")
-        
+        # %-style args defer formatting until the logger knows DEBUG is on
+        self.logger.debug("Making %s request to %s", method, url)
+
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-            
-            self.logger.debug(f"Request successful: {response.status_code}")
+
+            self.logger.debug("Request successful: %s", response.status_code)
             return response
             
         except requests.exceptions.RequestException as e:
@@ -2,29 +2,170 @@
 Honeywell Thermostat API client using username/password authentication.
 """
 import json
+import os
+import time
+import pickle
 import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Any, List
+import requests
+import requests.utils
 from .base_client import BaseAPIClient
 
+# Acquired once at import instead of per instance in __init__
+logger = logging.getLogger("HoneywellAPI")
+
+# orjson is an optional accelerator for encoding request payloads
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 
 class HoneywellAPI(BaseAPIClient):
     """Honeywell Total Connect Comfort API client with username/password auth."""
-    
+
+    # Precompiled pieces of the SubmitControlScreenChanges write: per-call
+    # code overlays the two varying fields on the template instead of
+    # rebuilding the full payload dict, endpoint, and headers each time
+    _SET_ENDPOINT = "/Device/SubmitControlScreenChanges"
+    _JSON_HEADERS = {'Content-Type': 'application/json'}
+    _SET_TEMPLATE = {
+        'SystemSwitch': None,
+        'HeatSetpoint': None,
+        'CoolSetpoint': 0,
+        'HeatNextPeriod': None,
+        'CoolNextPeriod': 81,  # Default value from your script
+        'StatusHeat': None,
+        'StatusCool': 1,
+        'DeviceID': '',
+    }
+
+    # Live instances by username; weak references so the registry never
+    # keeps a client alive that the rest of the program has dropped
+    _instances: "weakref.WeakValueDictionary[str, HoneywellAPI]" = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get_shared(cls, username: str, password: str) -> "HoneywellAPI":
+        """
+        Return a process-wide shared client for this account.
+
+        Callers that would otherwise build a client per operation should use
+        this to reuse the existing live session (and its lazily established
+        authentication) instead.
+
+        Args:
+            username: Honeywell account username
+            password: Honeywell account password
+
+        Returns:
+            HoneywellAPI: Existing authenticated client, or a fresh one
+        """
+        client = cls._instances.get(username)
+        if client is None:
+            client = cls(username, password)
+            cls._instances[username] = client
+        return client
+
     def __init__(self, username: str, password: str):
         super().__init__(base_url="https://www.mytotalconnectcomfort.com/portal")
         self.username = username
         self.password = password
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = logger
         self.authenticated = False
-        
+
+        # Short-TTL cache of thermostat data keyed by ID; collapses the
+        # repeated reads different accessors make within one sweep
+        self._data_cache: Dict[str, tuple] = {}
+        self._cache_ttl = 10.0
+
+        # ETag bookkeeping for conditional GETs: when the portal answers 304
+        # we reuse the last parsed body instead of transferring it again
+        self._etag: Dict[str, str] = {}
+        self._last_data: Dict[str, Dict[str, Any]] = {}
+
+        # Session cookies persist here between process runs so short-lived
+        # invocations can skip the two-request login dance
+        self.cookie_file = Path.home() / '.cache' / 'powermgr' / 'honeywell.cookies'
+        self._session_max_age = 3600  # Seconds before cached cookies expire
+
         # Set required headers
         self.session.headers.update({
             'X-Requested-With': 'XMLHttpRequest'
         })
-        
-        # Authenticate on initialization
-        self._authenticate()
-        
+
+        # Authentication is deferred to first use (_ensure_authenticated) so
+        # constructing a client does no blocking network I/O; warm the
+        # TCP+TLS connection in the background so the eventual login or
+        # cookie probe skips the handshake
+        self.warm_up()
+
+    def _ensure_authenticated(self) -> None:
+        """Authenticate on first use, preferring cached session cookies."""
+        if self.authenticated:
+            return
+        if not self._restore_session():
+            self._authenticate()
+
+    def _restore_session(self) -> bool:
+        """
+        Try to rehydrate a previously authenticated session from disk.
+
+        Returns:
+            bool: True if cached cookies were valid and the probe confirmed
+                  the session is still live
+        """
+        try:
+            if not self.cookie_file.exists():
+                return False
+
+            with open(self.cookie_file, 'rb') as f:
+                cached = pickle.load(f)
+
+            if time.time() > cached.get('expires', 0):
+                return False
+
+            self.session.cookies = requests.utils.cookiejar_from_dict(cached['cookies'])
+
+            # Cheap probe - a login redirect means the session is stale
+            response = self.session.get(self.base_url, timeout=30)
+            if 'login' in response.url.lower() or response.status_code != 200:
+                return False
+
+            self.authenticated = True
+            self.logger.info("Restored Honeywell session from cached cookies")
+            return True
+
+        except Exception as e:
+            self.logger.debug(f"Could not restore cached session: {str(e)}")
+            return False
+
+    def _save_session(self) -> None:
+        """Persist the authenticated session cookies for the next process."""
+        try:
+            self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+
+            payload = {
+                'expires': time.time() + self._session_max_age,
+                'cookies': requests.utils.dict_from_cookiejar(self.session.cookies)
+            }
+
+            # Write atomically with owner-only permissions
+            temp_file = self.cookie_file.with_suffix('.tmp')
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(payload, f)
+            os.replace(temp_file, self.cookie_file)
+
+        except Exception as e:
+            self.logger.warning(f"Failed to cache session cookies: {str(e)}")
+
     def _authenticate(self) -> None:
         """Authenticate with Honeywell using username/password."""
         try:
@@ -44,11 +185,14 @@ class HoneywellAPI(BaseAPIClient):
             response.raise_for_status()
             
             # Check if login was successful by parsing JSON response
-            login_result = response.json()
+            login_result = self._parse_json(response)
             
             # If we get here without exception, assume success
             self.authenticated = True
             self.logger.info("Successfully authenticated with Honeywell API")
+
+            # Cache the fresh cookies so the next process can skip login
+            self._save_session()
             
         except Exception as e:
             self.logger.error(f"Failed to authenticate with Honeywell: {str(e)}")
@@ -57,35 +201,74 @@ class HoneywellAPI(BaseAPIClient):
             
     def health_check(self) -> bool:
         """Check if Honeywell API is accessible and we're authenticated."""
+        try:
+            self._ensure_authenticated()
+        except Exception:
+            return False
         return self.authenticated
             
-    def get_thermostat_data(self, thermostat_id: str) -> Dict[str, Any]:
+    def get_thermostat_data(self, thermostat_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get thermostat data for a specific thermostat using CheckDataSession endpoint.
-        
+
         Args:
             thermostat_id: Thermostat device ID
-            
+            use_cache: Serve recently fetched data when within the cache TTL
+
         Returns:
             dict: Thermostat data including current temperature, setpoints, etc.
         """
         try:
-            if not self.authenticated:
-                self._authenticate()
-                
+            # Serve from cache while fresh, so back-to-back accessors don't
+            # each pay an HTTP round-trip for the same data
+            if use_cache:
+                cached = self._data_cache.get(thermostat_id)
+                if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                    self.logger.debug("Using cached thermostat data for %s", thermostat_id)
+                    return cached[1]
+
+            self._ensure_authenticated()
+
             # Use the CheckDataSession endpoint like in your working script
             endpoint = f"/Device/CheckDataSession/{thermostat_id}"
-            response = self.get(endpoint)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            self.logger.debug(f"Retrieved thermostat data for {thermostat_id}")
+
+            # Make the request conditional when we hold an ETag for this device
+            headers = {}
+            etag = self._etag.get(thermostat_id)
+            if etag:
+                headers['If-None-Match'] = etag
+
+            response = self.get(endpoint, headers=headers)
+
+            if response.status_code == 304 and thermostat_id in self._last_data:
+                # Unchanged on the server - skip the transfer and re-parse
+                data = self._last_data[thermostat_id]
+                self.logger.debug("Thermostat data for %s unchanged (304)", thermostat_id)
+            else:
+                data = self._parse_json(response)
+
+                new_etag = response.headers.get('ETag')
+                if new_etag:
+                    self._etag[thermostat_id] = new_etag
+                self._last_data[thermostat_id] = data
+
+            self._data_cache[thermostat_id] = (time.monotonic(), data)
+
+            self.logger.debug("Retrieved thermostat data for %s", thermostat_id)
             return data
-            
+
         except Exception as e:
             self.logger.error(f"Failed to get thermostat data for {thermostat_id}: {str(e)}")
             raise
+
+    def invalidate(self, thermostat_id: str) -> None:
+        """
+        Drop cached data for a thermostat (e.g. after writing a setpoint).
+
+        Args:
+            thermostat_id: Thermostat device ID
+        """
+        self._data_cache.pop(thermostat_id, None)
             
     def get_cool_setpoint(self, thermostat_id: str) -> int:
         """
@@ -103,62 +286,168 @@ class HoneywellAPI(BaseAPIClient):
             # Extract cool setpoint from the latestData.uiData structure
             cool_setpoint = thermostat_data['latestData']['uiData']['CoolSetpoint']
             
-            self.logger.debug(f"Cool setpoint for {thermostat_id}: {cool_setpoint}°F")
+            self.logger.debug("Cool setpoint for %s: %s°F", thermostat_id, cool_setpoint)
             return int(cool_setpoint)
             
         except Exception as e:
             self.logger.error(f"Failed to get cool setpoint for {thermostat_id}: {str(e)}")
             raise
             
-    def set_thermostat_cool_setpoint(self, thermostat_id: str, temperature: int) -> bool:
+    def set_thermostat_cool_setpoint(self, thermostat_id: str, temperature: int,
+                                     verify: bool = False) -> bool:
         """
         Set cooling setpoint for a thermostat using the SubmitControlScreenChanges endpoint.
-        
+
+        The portal reports acceptance in the POST response itself, so by
+        default no follow-up read is issued; pass verify=True to read the
+        setpoint back and confirm.
+
         Args:
             thermostat_id: Thermostat device ID
             temperature: Temperature to set in Fahrenheit
-            
+            verify: Re-read the setpoint after writing to confirm the change
+
         Returns:
             bool: True if successful, False otherwise
         """
         if not 60 <= temperature <= 90:
             raise ValueError(f"Temperature must be between 60-90°F, got {temperature}")
-            
+
         try:
-            if not self.authenticated:
-                self._authenticate()
-                
-            # Prepare the data payload matching your working script format
-            data = {
-                'SystemSwitch': None,
-                'HeatSetpoint': None,
-                'CoolSetpoint': temperature,
-                'HeatNextPeriod': None,
-                'CoolNextPeriod': 81,  # Default value from your script
-                'StatusHeat': None,
-                'StatusCool': 1,
-                'DeviceID': thermostat_id,
-            }
-            
-            # Use the SubmitControlScreenChanges endpoint
-            endpoint = "/Device/SubmitControlScreenChanges"
-            response = self.post(endpoint, data=data)
-            response.raise_for_status()
-            
-            # Verify the change by getting the new setpoint
-            new_setpoint = self.get_cool_setpoint(thermostat_id)
-            
-            if new_setpoint == temperature:
-                self.logger.info(f"Successfully set cool setpoint to {temperature}°F for {thermostat_id}")
-                return True
-            else:
-                self.logger.warning(f"Setpoint verification failed: requested {temperature}°F, got {new_setpoint}°F")
+            self._ensure_authenticated()
+
+            # Overlay the varying fields on the precompiled payload template
+            data = dict(self._SET_TEMPLATE, CoolSetpoint=temperature,
+                        DeviceID=thermostat_id)
+
+            # The portal accepts JSON, which skips requests' per-call
+            # urlencoding of the dict
+            response = self.post(self._SET_ENDPOINT, data=_json_dumps(data),
+                                 headers=self._JSON_HEADERS)
+
+            # The portal answers {"success": 1} when the submission is accepted
+            try:
+                submit_result = self._parse_json(response)
+            except ValueError:
+                submit_result = {}
+
+            if not submit_result.get('success', 1):
+                self.logger.warning(f"Setpoint submission rejected for {thermostat_id}: {submit_result}")
+                self.invalidate(thermostat_id)
                 return False
-                
+
+            if verify:
+                # Optional read-back for callers that want confirmation
+                self.invalidate(thermostat_id)
+                new_setpoint = self.get_cool_setpoint(thermostat_id)
+
+                if new_setpoint != temperature:
+                    self.logger.warning(f"Setpoint verification failed: requested {temperature}°F, got {new_setpoint}°F")
+                    return False
+            else:
+                # Optimistically patch the cached data instead of re-fetching
+                cached = self._data_cache.get(thermostat_id)
+                if cached is not None:
+                    try:
+                        cached[1]['latestData']['uiData']['CoolSetpoint'] = temperature
+                    except (KeyError, TypeError):
+                        self.invalidate(thermostat_id)
+
+            self.logger.info("Successfully set cool setpoint to %s°F for %s", temperature, thermostat_id)
+            return True
+
         except Exception as e:
             self.logger.error(f"Failed to set cool setpoint for {thermostat_id}: {str(e)}")
             return False
             
+    def set_cool_setpoints(self, setpoints: Dict[str, int], verify: bool = False) -> Dict[str, bool]:
+        """
+        Set cooling setpoints for several thermostats with concurrent POSTs.
+
+        All temperatures are validated up front, then the per-device writes
+        are issued in parallel over the shared keep-alive session so total
+        latency is roughly one round-trip instead of one per thermostat.
+
+        Args:
+            setpoints: Mapping of thermostat device ID to temperature (°F)
+            verify: Re-read each setpoint after writing to confirm
+
+        Returns:
+            dict: Mapping of thermostat_id to success flag
+        """
+        # Validate everything before touching the network
+        for thermostat_id, temperature in setpoints.items():
+            if not 60 <= temperature <= 90:
+                raise ValueError(f"Temperature must be between 60-90°F, got {temperature} for {thermostat_id}")
+
+        results: Dict[str, bool] = {}
+
+        if not setpoints:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(len(setpoints), 10)) as executor:
+            futures = [(tid, executor.submit(self.set_thermostat_cool_setpoint, tid, temp, verify))
+                       for tid, temp in setpoints.items()]
+
+            for thermostat_id, future in futures:
+                try:
+                    results[thermostat_id] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to set setpoint for thermostat {thermostat_id}: {str(e)}")
+                    results[thermostat_id] = False
+
+        return results
+
+    def get_cool_setpoints(self, thermostat_ids: List[str]) -> Dict[str, int]:
+        """
+        Get cooling setpoints for several thermostats with one parallel sweep.
+
+        Fetches all device payloads concurrently, then extracts just the
+        setpoint leaf per device in a single comprehension instead of
+        repeating the nested lookups and per-ID logging of the scalar getter.
+
+        Args:
+            thermostat_ids: List of thermostat device IDs
+
+        Returns:
+            dict: Mapping of thermostat_id to cool setpoint (°F); devices
+                  that failed to fetch are omitted
+        """
+        results = self.get_all_thermostats_data(thermostat_ids)
+
+        _latest, _ui, _cs = 'latestData', 'uiData', 'CoolSetpoint'
+        setpoints: Dict[str, int] = {}
+        for thermostat_id, data in results.items():
+            try:
+                setpoints[thermostat_id] = int(data[_latest][_ui][_cs])
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.error(f"Failed to extract cool setpoint for {thermostat_id}: {str(e)}")
+
+        return setpoints
+
+    def get_current_temperatures(self, thermostat_ids: List[str]) -> Dict[str, float]:
+        """
+        Get current temperatures for several thermostats with one parallel sweep.
+
+        Args:
+            thermostat_ids: List of thermostat device IDs
+
+        Returns:
+            dict: Mapping of thermostat_id to current temperature (°F);
+                  devices that failed to fetch are omitted
+        """
+        results = self.get_all_thermostats_data(thermostat_ids)
+
+        _latest, _ui, _dt = 'latestData', 'uiData', 'DispTemperature'
+        temperatures: Dict[str, float] = {}
+        for thermostat_id, data in results.items():
+            try:
+                temperatures[thermostat_id] = float(data[_latest][_ui][_dt])
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.error(f"Failed to extract temperature for {thermostat_id}: {str(e)}")
+
+        return temperatures
+
     def get_current_temperature(self, thermostat_id: str) -> float:
         """
         Get current temperature reading from thermostat.
@@ -175,7 +464,7 @@ class HoneywellAPI(BaseAPIClient):
             # Extract current temperature from the latestData.uiData structure
             current_temp = thermostat_data['latestData']['uiData']['DispTemperature']
             
-            self.logger.debug(f"Current temperature for {thermostat_id}: {current_temp}°F")
+            self.logger.debug("Current temperature for %s: %s°F", thermostat_id, current_temp)
             return float(current_temp)
             
         except Exception as e:
@@ -193,30 +482,56 @@ class HoneywellAPI(BaseAPIClient):
             dict: Dictionary mapping thermostat_id to thermostat data
         """
         thermostats_data = {}
-        
-        for thermostat_id in thermostat_ids:
-            try:
-                data = self.get_thermostat_data(thermostat_id)
-                thermostats_data[thermostat_id] = data
-            except Exception as e:
-                self.logger.error(f"Failed to get data for thermostat {thermostat_id}: {str(e)}")
-                # Continue with other thermostats
-                continue
-                
+
+        if not thermostat_ids:
+            return thermostats_data
+
+        # Each fetch is an independent HTTPS GET, so fan them out in parallel;
+        # the shared session's connection pool handles the concurrency
+        with ThreadPoolExecutor(max_workers=min(len(thermostat_ids), 10)) as executor:
+            futures = [(tid, executor.submit(self.get_thermostat_data, tid))
+                       for tid in thermostat_ids]
+
+            for thermostat_id, future in futures:
+                try:
+                    thermostats_data[thermostat_id] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to get data for thermostat {thermostat_id}: {str(e)}")
+                    # Continue with other thermostats
+                    continue
+
         return thermostats_data
     
-    def _re_authenticate_if_needed(self):
-        """Re-authenticate if session has expired."""
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Make a request, transparently re-authenticating on session expiry.
+
+        Expiry is detected from the actual response - a 401/403 status or a
+        redirect to the login page - rather than a separate probe request,
+        so the check costs nothing on the happy path. The retry happens at
+        most once per call to prevent loops.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, etc.)
+            endpoint: API endpoint
+            **kwargs: Additional arguments for requests
+
+        Returns:
+            requests.Response object
+        """
         try:
-            # Try a simple operation to test if we're still authenticated
-            # This is a simple way to check without making assumptions about response format
-            response = self.session.get(f"{self.base_url}/", timeout=30)
-            
-            # If we get a login page or redirect, we need to re-authenticate
-            if 'login' in response.url.lower() or response.status_code != 200:
+            response = super()._make_request(method, endpoint, **kwargs)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code in (401, 403):
                 self.logger.info("Session expired, re-authenticating...")
                 self._authenticate()
-                
-        except Exception as e:
-            self.logger.warning(f"Authentication check failed, attempting re-auth: {e}")
+                return super()._make_request(method, endpoint, **kwargs)
+            raise
+
+        # A 200 that landed on the login page is also an expired session
+        if 'login' in response.url.lower():
+            self.logger.info("Session expired, re-authenticating...")
             self._authenticate()
+            return super()._make_request(method, endpoint, **kwargs)
+
+        return response
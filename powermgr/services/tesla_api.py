@@ -1,13 +1,38 @@
 """
 Tesla Powerwall API client with token file management and refresh logic.
 """
+import os
 import json
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 import requests
 from .base_client import BaseAPIClient
 
+# orjson is an optional accelerator for token-file parsing
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+# Acquired once at import; getLogger takes the logging module's global
+# lock, so per-instance acquisition in __init__ is avoidable work
+logger = logging.getLogger("TeslaAPI")
+
 
 class TeslaTokenError(Exception):
     """Raised when token operations fail."""
@@ -17,23 +42,65 @@ class TeslaTokenError(Exception):
 class TeslaAPI(BaseAPIClient):
     """Tesla Powerwall API client with automatic token refresh."""
     
-    def __init__(self, token_file_path: str, energy_site_id: str, client_id: str = None):
+    def __init__(self, token_file_path: str, energy_site_id: str, client_id: str = None,
+                 cache_ttl: float = 2.0):
         """
         Initialize Tesla Powerwall API client.
-        
+
         Args:
             token_file_path: Path to the tesla_token.json file
             energy_site_id: Tesla energy site ID
             client_id: Tesla app client ID (optional, for refresh)
+            cache_ttl: Seconds to serve repeated endpoint reads from memory
+                       (0 disables caching)
         """
         super().__init__(base_url="https://owner-api.teslamotors.com")
-        
+
         self.token_file_path = Path(token_file_path)
         self.energy_site_id = energy_site_id
         self.client_id = client_id
         self._token_data: Optional[Dict] = None
-        self.logger = logging.getLogger(self.__class__.__name__)
-        
+        self.logger = logger
+
+        # Short-TTL cache of parsed endpoint payloads; the accessor methods
+        # all funnel through live_status/site_info, so back-to-back calls
+        # within one control tick share a single HTTPS round-trip
+        self._cache: Dict[str, tuple] = {}
+        self._cache_ttl = cache_ttl
+
+        # Wall-clock time the access token expires (None when unknown);
+        # used to refresh proactively instead of burning a 401 round-trip
+        self._token_expires_at: Optional[float] = None
+
+        # Serializes token refreshes; concurrent callers that lose the race
+        # reuse the winner's token instead of POSTing a duplicate refresh
+        self._refresh_lock = threading.Lock()
+
+        # Dedicated session for auth.tesla.com, kept for the process lifetime
+        # so repeat refreshes reuse the pooled TLS connection; separate from
+        # the main session to avoid circular auth calls
+        self._refresh_session = requests.Session()
+
+        # Small pool for overlapping the independent live_status/site_info
+        # fetches in get_snapshot
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
+        # Endpoint paths are fixed per site - build them once instead of
+        # re-interpolating on every call in the polling loop
+        self._url_live = f"/api/1/energy_sites/{energy_site_id}/live_status"
+        self._url_site = f"/api/1/energy_sites/{energy_site_id}/site_info"
+        self._url_backup = f"/api/1/energy_sites/{energy_site_id}/backup"
+
+        # Optional background cache warmer (see start_prefetch)
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self._prefetch_stop: Optional[threading.Event] = None
+        self._prefetch_interval: float = 0.0
+
+        # The shared base-client adapter already provides the enlarged
+        # connection pool and retry strategy; just make keep-alive explicit
+        # so the pooled connection survives across polling ticks
+        self.session.headers['Connection'] = 'keep-alive'
+
         # Load initial token
         self._load_token()
         
@@ -46,15 +113,33 @@ class TeslaAPI(BaseAPIClient):
             if not self.token_file_path.exists():
                 raise TeslaTokenError(f"Token file not found: {self.token_file_path}")
             
-            with open(self.token_file_path, 'r') as f:
-                self._token_data = json.load(f)
+            with open(self.token_file_path, 'rb') as f:
+                self._token_data = _json_loads(f.read())
             
             # Validate required fields
             required_fields = ['access_token', 'token_type']
             for field in required_fields:
                 if field not in self._token_data:
                     raise TeslaTokenError(f"Missing required token field: {field}")
-            
+
+            # Recover expiry timing if a previous run persisted it; a token
+            # still inside its window is used as-is, so restarts don't hit
+            # auth.tesla.com at all
+            self._token_expires_at = self._token_data.get('expires_at')
+
+            # Refresh a stale token once at startup rather than letting the
+            # first real request pay for it; failures are left to the
+            # proactive/401 paths, which will retry
+            if (self._token_expires_at is not None
+                    and self._token_expires_at - time.time() < 60
+                    and self.client_id
+                    and 'refresh_token' in self._token_data):
+                self.logger.info("Persisted token expired, refreshing at startup")
+                try:
+                    self._refresh_token()
+                except TeslaTokenError as e:
+                    self.logger.warning(f"Startup token refresh failed: {str(e)}")
+
             self.logger.info("Loaded Tesla token from file")
             
         except (json.JSONDecodeError, KeyError) as e:
@@ -65,14 +150,27 @@ class TeslaAPI(BaseAPIClient):
     def _save_token(self) -> None:
         """Save token to file."""
         try:
-            # Write atomically using a temporary file
+            # Write atomically: owner-only temp file, fsync'd before the
+            # rename so a crash can't lose a freshly rotated refresh token
+            # (which would force a full re-auth with Tesla)
             temp_file = self.token_file_path.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(self._token_data, f, indent=2)
-            
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(self._token_data))
+                f.flush()
+                os.fsync(f.fileno())
+
             temp_file.replace(self.token_file_path)
+
+            # Flush the rename itself so the directory entry survives a crash
+            dir_fd = os.open(self.token_file_path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
             self.logger.info("Tesla token saved to file")
-            
+
         except Exception as e:
             raise TeslaTokenError(f"Failed to save token: {e}")
     
@@ -80,9 +178,13 @@ class TeslaAPI(BaseAPIClient):
         """Update the authorization header with current token."""
         if not self._token_data:
             raise TeslaTokenError("No token data available")
-            
+
+        # Compose the header value once per token; anything that needs to
+        # hand the credential off (e.g. worker threads) reads _auth_header
+        # instead of reassembling it
+        self._auth_header = f"{self._token_data['token_type']} {self._token_data['access_token']}"
         self.session.headers.update({
-            "Authorization": f"{self._token_data['token_type']} {self._token_data['access_token']}",
+            "Authorization": self._auth_header,
             "Content-Type": "application/json"
         })
     
@@ -93,54 +195,70 @@ class TeslaAPI(BaseAPIClient):
         
         if not self.client_id:
             raise TeslaTokenError("Client ID required for token refresh")
-        
-        self.logger.info("Refreshing Tesla token...")
-        
-        refresh_data = {
-            'grant_type': 'refresh_token',
-            'client_id': self.client_id,
-            'refresh_token': self._token_data['refresh_token']
-        }
-        
-        try:
-            # Use a separate session for token refresh to avoid circular calls
-            refresh_session = requests.Session()
-            response = refresh_session.post(
-                "https://auth.tesla.com/oauth2/v3/token",
-                data=refresh_data,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            new_token_data = response.json()
-            
-            # Update token data with new values
-            self._token_data.update({
-                'access_token': new_token_data['access_token'],
-                'token_type': new_token_data.get('token_type', 'Bearer'),
-                'expires_in': new_token_data.get('expires_in', 28800)
-            })
-            
-            # Update refresh token if provided (Tesla may rotate it)
-            if 'refresh_token' in new_token_data:
-                self._token_data['refresh_token'] = new_token_data['refresh_token']
-            
-            # Update id_token if provided
-            if 'id_token' in new_token_data:
-                self._token_data['id_token'] = new_token_data['id_token']
-            
-            # Save updated token to file
-            self._save_token()
-            
-            # Update auth header with new token
-            self._update_auth_header()
-            
-            self.logger.info("Tesla token refreshed successfully")
-            
-        except requests.RequestException as e:
-            raise TeslaTokenError(f"Failed to refresh token: {e}")
-        except (KeyError, json.JSONDecodeError) as e:
-            raise TeslaTokenError(f"Invalid refresh token response: {e}")
+
+        # Single-flight: if another thread refreshes while we wait for the
+        # lock, the access token changes - reuse that result rather than
+        # POSTing a duplicate refresh (Tesla may rotate the refresh token,
+        # so a second refresh can invalidate the first one's copy)
+        old_access = self._token_data['access_token']
+
+        with self._refresh_lock:
+            if self._token_data['access_token'] != old_access:
+                self.logger.debug("Token already refreshed by another caller")
+                return
+
+            self.logger.info("Refreshing Tesla token...")
+
+            refresh_data = {
+                'grant_type': 'refresh_token',
+                'client_id': self.client_id,
+                'refresh_token': self._token_data['refresh_token']
+            }
+
+            try:
+                # The persistent refresh session keeps auth.tesla.com separate
+                # from the main API session (no circular calls) while reusing
+                # its warm connection across refreshes
+                response = self._refresh_session.post(
+                    "https://auth.tesla.com/oauth2/v3/token",
+                    data=refresh_data,
+                    timeout=30
+                )
+                response.raise_for_status()
+
+                new_token_data = self._parse_json(response)
+
+                # Update token data with new values
+                expires_in = new_token_data.get('expires_in', 28800)
+                self._token_expires_at = time.time() + expires_in
+                self._token_data.update({
+                    'access_token': new_token_data['access_token'],
+                    'token_type': new_token_data.get('token_type', 'Bearer'),
+                    'expires_in': expires_in,
+                    # Persisted so restarts keep the proactive refresh timing
+                    'expires_at': self._token_expires_at
+                })
+
+                # Update refresh token if provided (Tesla may rotate it)
+                if 'refresh_token' in new_token_data:
+                    self._token_data['refresh_token'] = new_token_data['refresh_token']
+
+                # Update id_token if provided
+                if 'id_token' in new_token_data:
+                    self._token_data['id_token'] = new_token_data['id_token']
+
+                # Save updated token to file
+                self._save_token()
+
+                # Update auth header with new token
+                self._update_auth_header()
+
+                self.logger.info("Tesla token refreshed successfully")
+
+            except requests.RequestException as e:
+                raise TeslaTokenError(f"Failed to refresh token: {e}")
+            except (KeyError, json.JSONDecodeError) as e:
+                raise TeslaTokenError(f"Invalid refresh token response: {e}")
     
     def _make_authenticated_request(self, method: str, url: str, **kwargs):
         """
@@ -148,17 +266,41 @@ class TeslaAPI(BaseAPIClient):
         
         This overrides the base client's behavior to handle token refresh.
         """
-        # Make the initial request
-        response = getattr(self.session, method.lower())(url, **kwargs)
-        
+        # Refresh proactively when the token is about to expire, saving the
+        # wasted 401 round-trip; the 401 fallback below covers clock skew
+        if (self._token_expires_at is not None
+                and self._token_expires_at - time.time() < 60
+                and self.client_id
+                and 'refresh_token' in (self._token_data or {})):
+            try:
+                self._refresh_token()
+            except TeslaTokenError as e:
+                self.logger.warning(f"Proactive token refresh failed: {str(e)}")
+
+        # Make the initial request; session.request takes the method name
+        # directly, avoiding the getattr/.lower() dispatch per call
+        response = self.session.request(method, url, **kwargs)
+
         # Handle token expiration with one retry
         if response.status_code == 401:
             self.logger.warning("Received 401 response, attempting token refresh")
             self._refresh_token()
-            
+
             # Retry the request with refreshed token
-            response = getattr(self.session, method.lower())(url, **kwargs)
-        
+            response = self.session.request(method, url, **kwargs)
+
+        # Honor an explicit rate limit once, so a burst doesn't cascade
+        # into a multi-minute lockout; the adapter-level Retry already
+        # backs off on 429, this covers responses that exhausted it
+        if response.status_code == 429:
+            try:
+                delay = min(int(response.headers.get('Retry-After', 1)), 30)
+            except ValueError:
+                delay = 1
+            self.logger.warning(f"Rate limited by Tesla API, retrying in {delay}s")
+            time.sleep(delay)
+            response = self.session.request(method, url, **kwargs)
+
         return response
     
     def get(self, endpoint: str, **kwargs):
@@ -176,15 +318,154 @@ class TeslaAPI(BaseAPIClient):
         url = f"{self.base_url}{endpoint}"
         return self._make_authenticated_request('PUT', url, **kwargs)
         
+    def _cached_get(self, endpoint: str, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        GET an endpoint, serving repeated reads from a short-TTL cache.
+
+        Args:
+            endpoint: API endpoint to fetch
+            ttl: Cache lifetime in seconds (defaults to the instance TTL)
+
+        Returns:
+            dict: Parsed JSON payload
+
+        Raises:
+            Exception: If the request fails
+        """
+        if ttl is None:
+            ttl = self._cache_ttl
+
+        entry = self._cache.get(endpoint)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        response = self.get(endpoint)
+        response.raise_for_status()
+        data = self._parse_json(response)
+
+        self._cache[endpoint] = (time.monotonic(), data)
+        return data
+
     def health_check(self) -> bool:
         """Check if Tesla API is accessible."""
         try:
-            response = self.get(f"/api/1/energy_sites/{self.energy_site_id}/live_status")
+            response = self.get(self._url_live)
             return response.status_code == 200
         except Exception as e:
             self.logger.warning(f"Tesla API health check failed: {str(e)}")
             return False
             
+    def start_prefetch(self, interval: float) -> None:
+        """
+        Start a daemon thread that keeps the endpoint cache warm.
+
+        Every `interval` seconds the thread force-refreshes live_status and
+        site_info, so foreground reads landing within the cache TTL of a
+        prefetch become dict lookups instead of network waits. Opt-in:
+        only worth enabling for callers that read far more often than the
+        service's slow tick. Token refreshes triggered from the prefetch
+        thread are safe via the single-flight lock.
+
+        Args:
+            interval: Seconds between prefetches
+        """
+        if self._prefetch_thread is not None and self._prefetch_thread.is_alive():
+            return
+
+        self._prefetch_interval = interval
+        self._prefetch_stop = threading.Event()
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_loop, name='tesla-prefetch', daemon=True)
+        self._prefetch_thread.start()
+        self.logger.info(f"Started Tesla prefetch thread (every {interval}s)")
+
+    def stop_prefetch(self) -> None:
+        """Stop the background prefetch thread, if running."""
+        if self._prefetch_stop is not None:
+            self._prefetch_stop.set()
+
+    def _prefetch_loop(self) -> None:
+        """Periodically re-fetch both endpoints to keep the cache fresh."""
+        while not self._prefetch_stop.wait(self._prefetch_interval):
+            try:
+                # Drop the entries first so _cached_get always re-fetches,
+                # leaving timestamps newer than the foreground TTL window
+                self._cache.pop(self._url_live, None)
+                self._cache.pop(self._url_site, None)
+                self._cached_get(self._url_live)
+                self._cached_get(self._url_site)
+            except Exception as e:
+                self.logger.debug("Prefetch failed: %s", e)
+
+    def get_snapshot(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch live_status and site_info concurrently.
+
+        The two endpoints are independent HTTPS GETs, so overlapping them
+        on the thread pool halves the wall-clock latency of composite
+        reads. Both go through _cached_get, so repeat calls within the TTL
+        are still coalesced.
+
+        Returns:
+            dict: {'live_status': dict or None, 'site_info': dict or None}
+                  holding each 'response' payload, None where a fetch failed
+        """
+        live_future = self._pool.submit(
+            self._cached_get, self._url_live)
+        site_future = self._pool.submit(
+            self._cached_get, self._url_site)
+
+        snapshot: Dict[str, Optional[Dict[str, Any]]] = {}
+        for key, future in (('live_status', live_future), ('site_info', site_future)):
+            try:
+                snapshot[key] = future.result()['response']
+            except Exception as e:
+                self.logger.warning(f"Snapshot fetch of {key} failed: {str(e)}")
+                snapshot[key] = None
+
+        return snapshot
+
+    def get_site_status(self) -> Dict[str, Any]:
+        """
+        Get API health, battery charge, and reserve setting in one snapshot.
+
+        Combines what health_check + get_battery_charge +
+        get_battery_reserve_setting would fetch, with the two underlying
+        endpoint reads overlapped, so a control tick pays roughly one HTTPS
+        round-trip of latency instead of several.
+
+        Returns:
+            dict: {'healthy': bool, 'battery_percent': float or None,
+                   'reserve_percent': int or None}
+        """
+        snapshot = self.get_snapshot()
+        live = snapshot['live_status']
+        site = snapshot['site_info']
+
+        status: Dict[str, Any] = {
+            'healthy': False,
+            'battery_percent': None,
+            'reserve_percent': None
+        }
+
+        if live is not None:
+            try:
+                status['battery_percent'] = float(live['percentage_charged'])
+                status['healthy'] = True
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.warning(f"Malformed live_status payload: {str(e)}")
+
+        if site is not None:
+            try:
+                status['reserve_percent'] = int(site['backup_reserve_percent'])
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.warning(f"Malformed site_info payload: {str(e)}")
+
+        # %-style args defer formatting (including the dict repr) until the
+        # logger knows DEBUG is actually enabled
+        self.logger.debug("Site status: %s", status)
+        return status
+
     def get_battery_charge(self) -> float:
         """
         Get current battery charge percentage.
@@ -196,14 +477,12 @@ class TeslaAPI(BaseAPIClient):
             Exception: If API call fails
         """
         try:
-            response = self.get(f"/api/1/energy_sites/{self.energy_site_id}/live_status")
-            response.raise_for_status()
-            data = response.json()
-            
+            data = self._cached_get(self._url_live)
+
             # Extract battery percentage from response
             battery_percent = data['response']['percentage_charged']
             
-            self.logger.debug(f"Current battery charge: {battery_percent}%")
+            self.logger.debug("Current battery charge: %s%%", battery_percent)
             return float(battery_percent)
             
         except Exception as e:
@@ -221,14 +500,12 @@ class TeslaAPI(BaseAPIClient):
             Exception: If API call fails
         """
         try:
-            response = self.get(f"/api/1/energy_sites/{self.energy_site_id}/site_info")
-            response.raise_for_status()
-            data = response.json()
-            
+            data = self._cached_get(self._url_site)
+
             # Extract backup reserve percent from response
             reserve_percent = data['response']['backup_reserve_percent']
             
-            self.logger.debug(f"Current reserve setting: {reserve_percent}%")
+            self.logger.debug("Current reserve setting: %s%%", reserve_percent)
             return int(reserve_percent)
             
         except Exception as e:
@@ -254,12 +531,12 @@ class TeslaAPI(BaseAPIClient):
         try:
             data = {"backup_reserve_percent": level}
             response = self.post(
-                f"/api/1/energy_sites/{self.energy_site_id}/backup",
+                self._url_backup,
                 json=data
             )
             
             if response.status_code == 200:
-                self.logger.info(f"Successfully set battery reserve to {level}%")
+                self.logger.info("Successfully set battery reserve to %s%%", level)
                 return True
             else:
                 self.logger.error(f"Failed to set reserve: HTTP {response.status_code}")
@@ -277,10 +554,8 @@ class TeslaAPI(BaseAPIClient):
             dict: Site information including battery status, grid status, etc.
         """
         try:
-            response = self.get(f"/api/1/energy_sites/{self.energy_site_id}/live_status")
-            response.raise_for_status()
-            data = response.json()
-            
+            data = self._cached_get(self._url_live)
+
             site_info = data['response']
             self.logger.debug("Retrieved energy site info")
             return site_info
@@ -300,7 +575,7 @@ class TeslaAPI(BaseAPIClient):
             site_info = self.get_energy_site_info()
             grid_status = site_info.get('island_status', 'Unknown')
             
-            self.logger.debug(f"Grid status: {grid_status}")
+            self.logger.debug("Grid status: %s", grid_status)
             return grid_status
             
         except Exception as e:
@@ -324,7 +599,7 @@ class TeslaAPI(BaseAPIClient):
                 'solar_power': site_info.get('solar_power', 0.0)
             }
             
-            self.logger.debug(f"Power flow: {power_flow}")
+            self.logger.debug("Power flow: %s", power_flow)
             return power_flow
             
         except Exception as e:
@@ -339,13 +614,11 @@ class TeslaAPI(BaseAPIClient):
             str: Operation mode ('self_consumption', 'backup', etc.)
         """
         try:
-            response = self.get(f"/api/1/energy_sites/{self.energy_site_id}/site_info")
-            response.raise_for_status()
-            data = response.json()
-            
+            data = self._cached_get(self._url_site)
+
             operation_mode = data['response'].get('default_real_mode', 'unknown')
             
-            self.logger.debug(f"Operation mode: {operation_mode}")
+            self.logger.debug("Operation mode: %s", operation_mode)
             return operation_mode
             
         except Exception as e:
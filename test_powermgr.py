@@ -7,14 +7,22 @@ Usage:
 
 Place this file in your project root directory alongside main.py and config.yaml
 """
+import os
 import sys
 import yaml
 import json
+import pickle
 import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
+# Prefer the LibYAML C parser when available - same behavior, much faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Import directly from the powermgr package
 from powermgr.core.manager import PowerManager
 from powermgr.services.tesla_api import TeslaAPI
@@ -34,13 +42,43 @@ class PowerManagerTester:
         self._initialize_components()
         
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+
+        Uses a pickle sidecar cache keyed on the source mtime, so repeat
+        tool invocations against an unchanged config.yaml skip the YAML
+        parse entirely.
+        """
         config_file = Path(self.config_path)
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        
+
+        src_mtime = config_file.stat().st_mtime_ns
+        cache_file = config_file.with_suffix('.yaml.cache')
+
+        # Reuse the cached parse if the source file hasn't changed
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get('mtime') == src_mtime:
+                    return cached['data']
+            except Exception:
+                pass  # Corrupt or stale cache - fall through to a full parse
+
         with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
+
+        # Write the cache atomically so a crash can't leave a partial file
+        try:
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                pickle.dump({'mtime': src_mtime, 'data': config}, f)
+            os.replace(temp_file, cache_file)
+        except Exception:
+            pass  # Caching is best-effort; the parsed config is still valid
+
+        return config
     
     def _setup_logging(self):
         """Set up logging for the test tool."""
@@ -165,7 +203,7 @@ class PowerManagerTester:
         print("🔄 Running full power management check...")
         
         try:
-            current_phase = self.power_manager._get_current_phase()
+            current_phase, _ = self.power_manager._get_current_phase()
             print(f"Current phase: {current_phase}")
             
             self.power_manager.run_check()
@@ -2,10 +2,8 @@
 Tests for the PowerManager core logic.
 """
 import pytest
-import json
-from unittest.mock import Mock, MagicMock, patch
-from datetime import datetime, time
-import pytz
+from unittest.mock import patch
+from datetime import datetime
 
 # Add the parent directory to the path for imports
 import sys
@@ -13,80 +11,186 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from powermgr.core.manager import PowerManager
-from powermgr.services.tesla_api import TeslaAPI
-from powermgr.services.honeywell_api import HoneywellAPI
-from powermgr.utils.metrics import MetricsRecorder
-from powermgr.utils.notifications import NotificationManager
 
 
-@pytest.fixture
-def mock_config():
-    """Sample configuration for testing."""
-    return {
-        'settings': {
-            'holidays': ['2025-01-01', '2025-07-04'],
-            'thermostat_increment_f': 2,
-            'precool_adjustment_f': 2,
-            'precool_threshold_f': 95,
-            'eod_battery_warning_threshold': 20,
-            'thermostat_ids': ['THERMO_1', 'THERMO_2'],
-            'location': 'America/Phoenix',
-            'battery_thresholds': [
-                {'time_remaining_minutes': 120, 'level_percent': 75},
-                {'time_remaining_minutes': 60, 'level_percent': 50},
-                {'time_remaining_minutes': 30, 'level_percent': 25}
-            ],
-            'seasons': {
-                'summer': {
-                    'months': [5, 6, 7, 8, 9, 10],
-                    'peak_periods': [
-                        {'start': '16:00', 'end': '19:00'}
-                    ]
-                },
-                'winter': {
-                    'months': [11, 12, 1, 2, 3, 4],
-                    'peak_periods': [
-                        {'start': '06:00', 'end': '09:00'},
-                        {'start': '17:00', 'end': '20:00'}
-                    ]
-                }
+# Fixed timestamp for fake state - no need to read the clock per test
+_FIXED_ISO = "2025-01-01T00:00:00"
+
+# Lightweight call-recording stubs. Plain attribute access and a list
+# append are far cheaper than Mock's reflective machinery, which
+# dominates runtime in mock-call-dense tests.
+
+class FakeTesla:
+    """Stub TeslaAPI recording calls in self.calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.healthy = True
+        self.battery_charge = 80.0
+        self.reserve_setting = 100
+
+    def health_check(self):
+        self.calls.append(('health_check',))
+        return self.healthy
+
+    def get_battery_charge(self):
+        self.calls.append(('get_battery_charge',))
+        return self.battery_charge
+
+    def get_battery_reserve_setting(self):
+        self.calls.append(('get_battery_reserve_setting',))
+        return self.reserve_setting
+
+    def set_reserve_percentage(self, percentage):
+        self.calls.append(('set_reserve_percentage', percentage))
+        return True
+
+    def get_site_status(self):
+        self.calls.append(('get_site_status',))
+        return {
+            'healthy': self.healthy,
+            'battery_percent': self.battery_charge,
+            'reserve_percent': self.reserve_setting
+        }
+
+
+class FakeHoneywell:
+    """Stub HoneywellAPI recording calls in self.calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.healthy = True
+        self.cool_setpoint = 75
+
+    def health_check(self):
+        self.calls.append(('health_check',))
+        return self.healthy
+
+    def get_cool_setpoint(self, thermostat_id):
+        self.calls.append(('get_cool_setpoint', thermostat_id))
+        return self.cool_setpoint
+
+    def set_thermostat_cool_setpoint(self, thermostat_id, temperature):
+        self.calls.append(('set_thermostat_cool_setpoint', thermostat_id, temperature))
+        return True
+
+
+class FakeMetrics:
+    """Stub MetricsRecorder holding state in memory."""
+
+    def __init__(self):
+        self.calls = []
+        self.state = {
+            'actions': [],
+            'battery_remaining': [],
+            'precooling': False,
+            'last_updated': _FIXED_ISO
+        }
+
+    def load_state(self):
+        self.calls.append(('load_state',))
+        return self.state
+
+    def _save_state(self, state):
+        self.calls.append(('_save_state', state))
+        self.state = state
+
+    def record_action(self, action, details=None):
+        self.calls.append(('record_action', action, details))
+
+    def record_event(self, event_data):
+        self.calls.append(('record_event', event_data))
+
+    def record_events_bulk(self, events):
+        self.calls.append(('record_events_bulk', events))
+
+    def set_precooling_status(self, precooling):
+        self.calls.append(('set_precooling_status', precooling))
+
+    def flush(self):
+        self.calls.append(('flush',))
+
+
+class FakeNotifications:
+    """Stub NotificationManager recording calls in self.calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def notify(self, level, message_type, details=None):
+        self.calls.append(('notify', level, message_type, details))
+        return True
+
+
+def _count(fake, name):
+    """Count recorded calls to the given method name."""
+    return sum(1 for call in fake.calls if call[0] == name)
+
+
+# Sample configuration, built once at import and never mutated; read-only
+# tests construct managers from it directly via _pm() without any fixture
+# resolution
+_BASE_CONFIG = {
+    'settings': {
+        'holidays': ['2025-01-01', '2025-07-04'],
+        'thermostat_increment_f': 2,
+        'precool_adjustment_f': 2,
+        'precool_threshold_f': 95,
+        'eod_battery_warning_threshold': 20,
+        'thermostat_ids': ['THERMO_1', 'THERMO_2'],
+        'location': 'America/Phoenix',
+        'battery_thresholds': [
+            {'time_remaining_minutes': 120, 'level_percent': 75},
+            {'time_remaining_minutes': 60, 'level_percent': 50},
+            {'time_remaining_minutes': 30, 'level_percent': 25}
+        ],
+        'seasons': {
+            'summer': {
+                'months': [5, 6, 7, 8, 9, 10],
+                'peak_periods': [
+                    {'start': '16:00', 'end': '19:00'}
+                ]
+            },
+            'winter': {
+                'months': [11, 12, 1, 2, 3, 4],
+                'peak_periods': [
+                    {'start': '06:00', 'end': '09:00'},
+                    {'start': '17:00', 'end': '20:00'}
+                ]
             }
         }
     }
+}
+
+
+def _pm(config=_BASE_CONFIG):
+    """Build a PowerManager wired to fresh fakes, bypassing fixtures."""
+    return PowerManager(
+        config=config,
+        tesla_client=FakeTesla(),
+        honeywell_client=FakeHoneywell(),
+        metrics_recorder=FakeMetrics(),
+        notification_manager=FakeNotifications()
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Sample configuration for testing; built once, never mutated."""
+    return _BASE_CONFIG
 
 
 @pytest.fixture
 def mock_clients():
-    """Create mock clients for testing."""
-    tesla_mock = Mock(spec=TeslaAPI)
-    honeywell_mock = Mock(spec=HoneywellAPI)
-    metrics_mock = Mock(spec=MetricsRecorder)
-    notifications_mock = Mock(spec=NotificationManager)
-    
-    # Set up default return values
-    tesla_mock.health_check.return_value = True
-    honeywell_mock.health_check.return_value = True
-    tesla_mock.get_battery_charge.return_value = 80.0
-    tesla_mock.get_battery_reserve_setting.return_value = 100
-    tesla_mock.set_reserve_percentage.return_value = True
-    honeywell_mock.get_cool_setpoint.return_value = 75
-    honeywell_mock.set_thermostat_cool_setpoint.return_value = True
-    
-    metrics_mock.load_state.return_value = {
-        'actions': [],
-        'battery_remaining': [],
-        'precooling': False,
-        'last_updated': datetime.now().isoformat()
-    }
-    
-    return tesla_mock, honeywell_mock, metrics_mock, notifications_mock
+    """Create fake clients for testing."""
+    return FakeTesla(), FakeHoneywell(), FakeMetrics(), FakeNotifications()
 
 
 @pytest.fixture
 def power_manager(mock_config, mock_clients):
     """Create PowerManager instance for testing."""
     tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-    
+
     return PowerManager(
         config=mock_config,
         tesla_client=tesla_mock,
@@ -96,189 +200,192 @@ def power_manager(mock_config, mock_clients):
     )
 
 
+# Read-only tests: these never assert on client call state, so they use
+# _pm() directly instead of going through the fixture DAG.
+
+def test_initialization():
+    """Test PowerManager initializes correctly."""
+    power_manager = _pm()
+    assert power_manager is not None
+    assert power_manager.thermostat_increment == 2
+    assert power_manager.precool_adjustment == 2
+    assert len(power_manager.thermostat_ids) == 2
+
+
+def test_get_current_phase_weekend():
+    """Test phase detection returns NON_PEAK for weekends."""
+    power_manager = _pm()
+
+    # Saturday 5 PM - would be peak on a summer weekday
+    phase, active_peak = power_manager._get_current_phase(datetime(2025, 8, 30, 17, 0))
+
+    assert phase == "NON_PEAK"
+    assert active_peak is None
+
+
+def test_get_current_phase_holiday():
+    """Test phase detection returns NON_PEAK for holidays."""
+    power_manager = _pm()
+
+    # New Year's Day (in config holidays), Wednesday 5 PM
+    phase, active_peak = power_manager._get_current_phase(datetime(2025, 1, 1, 17, 0))
+
+    assert phase == "NON_PEAK"
+    assert active_peak is None
+
+
+def test_get_current_phase_summer_peak():
+    """Test phase detection for summer peak period."""
+    power_manager = _pm()
+
+    # Summer weekday during peak (5 PM in August)
+    phase, active_peak = power_manager._get_current_phase(datetime(2025, 8, 27, 17, 0))
+
+    assert phase == "PEAK_MONITOR"
+    assert active_peak is not None
+
+
 class TestPowerManager:
     """Test cases for PowerManager class."""
-    
-    def test_initialization(self, power_manager):
-        """Test PowerManager initializes correctly."""
-        assert power_manager is not None
-        assert power_manager.thermostat_increment == 2
-        assert power_manager.precool_adjustment == 2
-        assert len(power_manager.thermostat_ids) == 2
-    
-    @patch('powermgr.core.manager.datetime')
-    def test_get_current_phase_weekend(self, mock_datetime, power_manager):
-        """Test phase detection returns NON_PEAK for weekends."""
-        # Mock Saturday
-        mock_datetime.now.return_value = datetime(2025, 8, 30, 17, 0)  # Saturday 5 PM
-        mock_datetime.now.return_value.date.return_value.weekday.return_value = 5
-        
-        phase = power_manager._get_current_phase()
-        assert phase == "NON_PEAK"
-    
-    @patch('powermgr.core.manager.datetime')
-    def test_get_current_phase_holiday(self, mock_datetime, power_manager):
-        """Test phase detection returns NON_PEAK for holidays."""
-        # Mock New Year's Day (in config holidays)
-        mock_datetime.now.return_value = datetime(2025, 1, 1, 17, 0)  # Wednesday 5 PM
-        mock_datetime.now.return_value.date.return_value.weekday.return_value = 2
-        mock_datetime.now.return_value.date.return_value.isoformat.return_value = "2025-01-01"
-        
-        phase = power_manager._get_current_phase()
-        assert phase == "NON_PEAK"
-    
-    @patch('powermgr.core.manager.datetime')
-    def test_get_current_phase_summer_peak(self, mock_datetime, power_manager):
-        """Test phase detection for summer peak period."""
-        # Mock summer weekday during peak (5 PM in August)
-        mock_now = Mock()
-        mock_now.month = 8
-        mock_now.time.return_value = time(17, 0)  # 5:00 PM
-        mock_now.date.return_value.weekday.return_value = 2  # Wednesday
-        mock_now.date.return_value.isoformat.return_value = "2025-08-27"
-        
-        mock_datetime.now.return_value = mock_now
-        
-        # Mock timezone
-        with patch.object(power_manager, 'timezone') as mock_tz:
-            mock_tz.localize = Mock(return_value=mock_now)
-            phase = power_manager._get_current_phase()
-        
-        assert phase == "PEAK_MONITOR"
-    
+
     def test_health_check_success(self, power_manager, mock_clients):
         """Test successful health check."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
+
         result = power_manager._run_health_check()
-        
+
         assert result is True
-        tesla_mock.health_check.assert_called_once()
-        honeywell_mock.health_check.assert_called_once()
-    
+        assert _count(tesla_mock, 'health_check') == 1
+        assert _count(honeywell_mock, 'health_check') == 1
+
     def test_health_check_failure(self, power_manager, mock_clients):
         """Test health check failure handling."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
+
         # Make Tesla API fail
-        tesla_mock.health_check.return_value = False
-        
+        tesla_mock.healthy = False
+
         result = power_manager._run_health_check()
-        
+
         assert result is False
-        notifications_mock.notify.assert_called_once()
-    
+        assert _count(notifications_mock, 'notify') == 1
+
     def test_handle_non_peak_period(self, power_manager, mock_clients):
         """Test non-peak period handling."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
+
         # Set current reserve to something other than 100%
-        tesla_mock.get_battery_reserve_setting.return_value = 0
-        
+        tesla_mock.reserve_setting = 0
+
         power_manager._handle_non_peak_period()
-        
+
         # Should set reserve to 100%
-        tesla_mock.set_reserve_percentage.assert_called_once_with(100)
-        metrics_mock.record_action.assert_called_once()
-    
+        assert tesla_mock.calls.count(('set_reserve_percentage', 100)) == 1
+        assert _count(metrics_mock, 'record_action') == 1
+
+    def test_handle_non_peak_noop_when_already_100(self, power_manager, mock_clients):
+        """Test non-peak handling skips the write when reserve is already 100%."""
+        tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
+
+        # Reserve is already at the non-peak target
+        tesla_mock.reserve_setting = 100
+
+        power_manager._handle_non_peak_period()
+
+        # No API write, no metrics row
+        assert _count(tesla_mock, 'set_reserve_percentage') == 0
+        assert _count(metrics_mock, 'record_action') == 0
+
     def test_handle_peak_period(self, power_manager, mock_clients):
         """Test peak period handling."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
+
         # Set current reserve to 100% (non-peak setting)
-        tesla_mock.get_battery_reserve_setting.return_value = 100
-        tesla_mock.get_battery_charge.return_value = 85.0
-        
+        tesla_mock.reserve_setting = 100
+        tesla_mock.battery_charge = 85.0
+
         power_manager._handle_peak_period()
-        
+
         # Should set reserve to 0%
-        tesla_mock.set_reserve_percentage.assert_called_once_with(0)
-        metrics_mock.record_battery_level.assert_called_once_with(85.0)
-        metrics_mock.record_action.assert_called_once()
-    
+        assert tesla_mock.calls.count(('set_reserve_percentage', 0)) == 1
+
+        # Battery level and reserve action are flushed in one bulk metrics write
+        bulk_calls = [call for call in metrics_mock.calls if call[0] == 'record_events_bulk']
+        assert len(bulk_calls) == 1
+        events = bulk_calls[0][1]
+        assert events[0] == {'battery_percent': 85.0}
+        assert events[1]['action'] == 'set_battery_reserve'
+
     def test_battery_low_detection(self, power_manager, mock_clients):
         """Test battery low detection logic."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
+
         # Mock battery at 70% with 120 minutes remaining (should trigger threshold)
-        tesla_mock.get_battery_charge.return_value = 70.0
-        
+        tesla_mock.battery_charge = 70.0
+
         with patch.object(power_manager, '_get_peak_time_remaining', return_value=120):
             result = power_manager._is_battery_low()
-        
+
         assert result is True
-    
+
     def test_thermostat_adjustment(self, power_manager, mock_clients):
         """Test thermostat adjustment for battery conservation."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
-        # Mock current setpoint
-        honeywell_mock.get_cool_setpoint.return_value = 75
-        honeywell_mock.set_thermostat_cool_setpoint.return_value = True
-        
+
         power_manager._adjust_thermostats_for_battery_conservation()
-        
+
         # Should adjust both thermostats by increment (2 degrees)
-        expected_calls = [
-            ((power_manager.thermostat_ids[0], 77), {}),
-            ((power_manager.thermostat_ids[1], 77), {})
-        ]
-        assert honeywell_mock.set_thermostat_cool_setpoint.call_count == 2
-        
-        # Should record actions and send notification
-        assert metrics_mock.record_action.call_count == 2
-        notifications_mock.notify.assert_called_once_with('info', 'battery_adjusted', {
+        assert _count(honeywell_mock, 'set_thermostat_cool_setpoint') == 2
+
+        # Both adjustments land in a single bulk metrics write
+        bulk_calls = [call for call in metrics_mock.calls if call[0] == 'record_events_bulk']
+        assert len(bulk_calls) == 1
+        events = bulk_calls[0][1]
+        assert len(events) == 2
+        assert all(event['action'] == 'adjust_thermostat' for event in events)
+
+        # Should send notification
+        assert notifications_mock.calls == [('notify', 'info', 'battery_adjusted', {
             'Thermostats Adjusted': 2,
             'Adjustment': '+2°F',
-            'Reason': 'Battery conservation during peak period'
-        })
-    
+            'Reason': 'Battery conservation during peak period',
+            'Adjustment Number': 1
+        })]
+
     def test_precooling_activation(self, power_manager, mock_clients):
         """Test precooling activation."""
         tesla_mock, honeywell_mock, metrics_mock, notifications_mock = mock_clients
-        
-        # Mock current setpoint
-        honeywell_mock.get_cool_setpoint.return_value = 75
-        honeywell_mock.set_thermostat_cool_setpoint.return_value = True
-        
+
         power_manager._activate_precooling()
-        
+
         # Should lower both thermostats by precool adjustment (2 degrees)
-        expected_calls = [
-            ((power_manager.thermostat_ids[0], 73), {}),
-            ((power_manager.thermostat_ids[1], 73), {})
-        ]
-        assert honeywell_mock.set_thermostat_cool_setpoint.call_count == 2
-        
+        assert _count(honeywell_mock, 'set_thermostat_cool_setpoint') == 2
+
         # Should set precooling status and send notification
-        metrics_mock.set_precooling_status.assert_called_once_with(True)
-        notifications_mock.notify.assert_called_once()
-    
-    @patch('powermgr.core.manager.datetime')
-    def test_peak_time_remaining_calculation(self, mock_datetime, power_manager):
+        assert metrics_mock.calls.count(('set_precooling_status', True)) == 1
+        assert _count(notifications_mock, 'notify') == 1
+
+    def test_classify_phases_matches_scalar_lookup(self, power_manager):
+        """Test batch phase classification agrees with _get_current_phase."""
+        from datetime import timedelta
+
+        # Every 10 minutes across a summer weekday and the following Saturday
+        start = datetime(2025, 8, 27, 0, 0)
+        timestamps = [start + timedelta(minutes=10 * i) for i in range(288)]
+
+        batch = power_manager.classify_phases(timestamps)
+
+        scalar = [power_manager._get_current_phase(ts)[0] for ts in timestamps]
+        assert batch == scalar
+        assert "PEAK_MONITOR" in batch  # summer peak hours are covered
+
+    def test_peak_time_remaining_calculation(self, power_manager):
         """Test calculation of time remaining in peak period."""
-        # Mock current time as 5:30 PM (30 minutes into summer peak)
-        mock_now = Mock()
-        mock_now.month = 8  # August (summer)
-        mock_now.time.return_value = time(17, 30)  # 5:30 PM
-        mock_now.date.return_value = datetime(2025, 8, 27).date()
-        
-        mock_datetime.now.return_value = mock_now
-        
-        # Mock datetime.combine and calculations
-        mock_end = Mock()
-        mock_end.total_seconds.return_value = 5400  # 90 minutes in seconds
-        
-        with patch('powermgr.core.manager.datetime') as mock_dt:
-            mock_dt.combine.return_value = Mock()
-            mock_dt.strptime.return_value.time.return_value = time(19, 0)  # 7:00 PM end
-            mock_dt.now.return_value = mock_now
-            
-            # Mock the subtraction to return our mock timedelta
-            mock_dt.combine.return_value.__sub__.return_value = mock_end
-            
-            result = power_manager._get_peak_time_remaining()
-        
+        # 5:30 PM on a summer weekday - 30 minutes into the 16:00-19:00 peak
+        now = datetime(2025, 8, 27, 17, 30)
+
+        result = power_manager._get_peak_time_remaining(now=now)
+
         assert result == 90  # 90 minutes remaining
 
 